@@ -6,12 +6,36 @@ Provide base classes for solvers, problems, and models.
 """
 
 import numpy as np
+import os
 from copy import deepcopy
+from collections import OrderedDict
 
 
 from rng.mrg32k3a import MRG32k3a
 
 
+def replicate_chunk(model, rng_list, m):
+    """Simulate a chunk of replications of a model; used by worker processes.
+
+    Parameters
+    ----------
+    model : ``base.Model``
+        Simulation model with its factors set.
+    rng_list : list [``rng.MRG32k3a``]
+        RNGs positioned at the start of the chunk's first replication.
+    m : int
+        Number of replications to simulate.
+
+    Returns
+    -------
+    responses : dict [numpy array]
+        Performance measures of interest; first axis indexes replications.
+    gradients : dict [dict [numpy array]]
+        Gradient estimate for each response; first axis indexes replications.
+    """
+    return model.replicate_batch(rng_list, m)
+
+
 class Solver(object):
     """Base class to implement simulation-optimization solvers.
 
@@ -178,9 +202,19 @@ class Solver(object):
         new_solution : ``base.Solution``
             New solution.
         """
-        # Create new solution with attached rngs.
-        new_solution = Solution(x, problem)
-        new_solution.attach_rngs(rng_list=self.solution_progenitor_rngs, copy=True)
+        # Reuse the solution at x if it was created from the same RNG positions.
+        if problem.solution_cache is not None:
+            key = problem.solution_cache.key(x, self.solution_progenitor_rngs)
+            new_solution = problem.solution_cache.get(key)
+        else:
+            new_solution = None
+        if new_solution is None:
+            # Create new solution with attached rngs.
+            # Only store gradient estimates if the solver uses them and the problem provides them.
+            new_solution = Solution(x, problem, store_gradients=self.gradient_needed and problem.gradient_available)
+            new_solution.attach_rngs(rng_list=self.solution_progenitor_rngs, copy=True)
+            if problem.solution_cache is not None:
+                problem.solution_cache.put(key, new_solution)
         # Manipulate progenitor rngs to prepare for next new solution.
         if not self.factors["crn_across_solns"]:  # If CRN are not used ...
             # ...advance each rng to start of the substream = current substream + # of model RNGs.
@@ -253,6 +287,23 @@ class Problem(object):
                 Max number of replications (fn evals) for a solver to take.
     specifications : dict
         Details of each factor (for GUI, data validation, and defaults).
+    executor : ``concurrent.futures.Executor``
+        Executor used to run chunks of replications in parallel, or None
+        to run replications serially.
+    chunk_size : int
+        Number of replications per chunk submitted to the executor, or None
+        to split replications evenly across CPUs.
+    solution_cache : ``base.SolutionCache``
+        Cache of solutions created by solvers, or None to always create
+        new solutions.
+    objective_response_map : tuple [dict]
+        For each objective, coefficients of the responses whose weighted sum
+        gives the objective, or None if objectives are only available through
+        ``response_dict_to_objectives``.
+    stoch_constraint_response_map : tuple [dict]
+        For each stochastic constraint, coefficients of the responses whose
+        weighted sum gives its LHS, or None if stochastic constraints are only
+        available through ``response_dict_to_stoch_constraints``.
 
     Parameters
     ----------
@@ -261,6 +312,16 @@ class Problem(object):
     model_fixed_factors : dict
         Subset of user-specified non-decision factors to pass through to the model.
     """
+    # Problems whose objectives and stochastic constraints are linear in the
+    # responses override these to convert batches of replications at once.
+    objective_response_map = None
+    stoch_constraint_response_map = None
+    # Simulate replications serially unless an executor is attached, and
+    # create new solutions unless a solution cache is attached.
+    executor = None
+    chunk_size = None
+    solution_cache = None
+
     def __init__(self, fixed_factors, model_fixed_factors):
         # Set factors of the problem.
         # Fill in missing factors with default values.
@@ -276,6 +337,22 @@ class Problem(object):
         self.model_fixed_factors = model_fixed_factors
         # super().__init__()
 
+    def __getstate__(self):
+        """Return the state of the problem used for pickling.
+        An attached executor cannot be pickled and an attached solution
+        cache is only needed by the solver, so neither is included.
+
+        Returns
+        -------
+        dict
+            Attributes of the problem other than ``executor`` and
+            ``solution_cache``.
+        """
+        state = self.__dict__.copy()
+        state.pop("executor", None)
+        state.pop("solution_cache", None)
+        return state
+
     def __eq__(self, other):
         """Check if two problems are equivalent.
 
@@ -391,6 +468,41 @@ class Problem(object):
         """
         self.rng_list = rng_list
 
+    def attach_executor(self, executor, chunk_size=None):
+        """Attach an executor used to simulate replications in parallel.
+
+        Parameters
+        ----------
+        executor : ``concurrent.futures.Executor``
+            Executor (e.g., a ``ProcessPoolExecutor``) to which chunks of
+            replications are submitted, or None to simulate serially.
+        chunk_size : int, optional
+            Number of replications per chunk. By default, replications are
+            split evenly across CPUs.
+        """
+        self.executor = executor
+        self.chunk_size = chunk_size
+
+    def attach_solution_cache(self, max_size=1000):
+        """Attach a cache that returns existing solutions to solvers that
+        recreate a solution at an already-visited point.
+
+        Notes
+        -----
+        A cached solution keeps its replications and RNG states, so
+        further replications continue its RNG streams. Caching changes the
+        results of solvers that re-simulate recreated solutions.
+
+        Parameters
+        ----------
+        max_size : int, default=1000
+            Max number of solutions to cache, or None to remove the cache.
+        """
+        if max_size is None:
+            self.solution_cache = None
+        else:
+            self.solution_cache = SolutionCache(max_size)
+
     def vector_to_factor_dict(self, vector):
         """
         Convert a vector of variables to a dictionary with factor keys.
@@ -546,7 +658,106 @@ class Problem(object):
         """
         pass
 
-    def simulate(self, solution, m=1):
+    def run_replications(self, rng_list, m, executor=None):
+        """Simulate `m` replications of the model at its current factors.
+
+        Notes
+        -----
+        With an executor, the replications are split into chunks. Each chunk
+        is simulated with copies of the rngs jumped to the subsubstream of the
+        chunk's first replication, so the results are identical to simulating
+        the replications serially.
+
+        Parameters
+        ----------
+        rng_list : list [``rng.MRG32k3a``]
+            RNGs for model to use when simulating the replications; they are
+            left at the start of the subsubstream following the last replication.
+        m : int
+            Number of replications to simulate.
+        executor : ``concurrent.futures.Executor``, optional
+            Executor to which chunks of replications are submitted;
+            defaults to the attached executor.
+
+        Returns
+        -------
+        responses : dict [numpy array]
+            Performance measures of interest; first axis indexes replications.
+        gradients : dict [dict [numpy array]]
+            Gradient estimate for each response; first axis indexes replications.
+        """
+        if executor is None:
+            executor = self.executor
+        chunk_size = self.chunk_size
+        if chunk_size is None:
+            chunk_size = int(np.ceil(m / (os.cpu_count() or 1)))
+        if executor is None or chunk_size >= m:
+            return self.model.replicate_batch(rng_list, m)
+        futures = self.submit_replications(executor, self.model, rng_list, m, chunk_size)
+        return self.collect_replications(futures, rng_list, m)
+
+    def submit_replications(self, executor, model, rng_list, m, chunk_size):
+        """Submit chunks of `m` replications of a model to an executor.
+
+        Parameters
+        ----------
+        executor : ``concurrent.futures.Executor``
+            Executor to which chunks of replications are submitted.
+        model : ``base.Model``
+            Simulation model with its factors set.
+        rng_list : list [``rng.MRG32k3a``]
+            RNGs positioned at the start of the first replication; not advanced.
+        m : int
+            Number of replications to simulate.
+        chunk_size : int
+            Number of replications per chunk.
+
+        Returns
+        -------
+        futures : list [``concurrent.futures.Future``]
+            Futures of the chunks, in order of replication.
+        """
+        futures = []
+        for start in range(0, m, chunk_size):
+            if start == 0:
+                chunk_rngs = [deepcopy(rng) for rng in rng_list]
+            else:
+                # Jump copies of rngs ahead to the chunk's first subsubstream.
+                chunk_rngs = [MRG32k3a(ref_seed=rng.ref_seed, s_ss_sss_index=[rng.s_ss_sss_index[0], rng.s_ss_sss_index[1], rng.s_ss_sss_index[2] + start]) for rng in rng_list]
+            futures.append(executor.submit(replicate_chunk, model, chunk_rngs, min(chunk_size, m - start)))
+        return futures
+
+    def collect_replications(self, futures, rng_list, m):
+        """Merge the results of chunks of replications submitted by
+        ``submit_replications``.
+
+        Parameters
+        ----------
+        futures : list [``concurrent.futures.Future``]
+            Futures of the chunks, in order of replication.
+        rng_list : list [``rng.MRG32k3a``]
+            RNGs used to submit the chunks; they are advanced to the start of
+            the subsubstream following the last replication.
+        m : int
+            Number of replications simulated.
+
+        Returns
+        -------
+        responses : dict [numpy array]
+            Performance measures of interest; first axis indexes replications.
+        gradients : dict [dict [numpy array]]
+            Gradient estimate for each response; first axis indexes replications.
+        """
+        results = [future.result() for future in futures]
+        # Merge chunks in order of replication.
+        responses = {response_key: np.concatenate([chunk_responses[response_key] for chunk_responses, _ in results]) for response_key in results[0][0]}
+        gradients = {response_key: {factor_key: np.concatenate([chunk_gradients[response_key][factor_key] for _, chunk_gradients in results]) for factor_key in results[0][1][response_key]} for response_key in results[0][1]}
+        # Advance rngs to start of subsubstream following the last replication.
+        for rng in rng_list:
+            rng.start_fixed_s_ss_sss([rng.s_ss_sss_index[0], rng.s_ss_sss_index[1], rng.s_ss_sss_index[2] + m])
+        return responses, gradients
+
+    def simulate(self, solution, m=1, executor=None):
         """Simulate `m` i.i.d. replications at solution `x`.
 
         Notes
@@ -560,6 +771,9 @@ class Problem(object):
             Solution to evalaute.
         m : int
             Number of replications to simulate at `x`.
+        executor : ``concurrent.futures.Executor``, optional
+            Executor used to simulate chunks of replications in parallel;
+            defaults to the attached executor.
         """
         if m < 1:
             print('--* Error: Number of replications must be at least 1. ')
@@ -570,9 +784,34 @@ class Problem(object):
                 solution.pad_storage(m)
             # Set the decision factors of the model.
             self.model.factors.update(solution.decision_factors)
-            for _ in range(m):
-                # Generate one replication at x.
-                responses, gradients = self.model.replicate(solution.rng_list)
+            # Generate m replications at x, advancing rngs to the start of
+            # the next subsubstream after each replication.
+            batch_responses, batch_gradients = self.run_replications(solution.rng_list, m, executor)
+            self.record_replications(solution, batch_responses, m)
+
+    def record_replications(self, solution, batch_responses, m):
+        """Record objectives and stochastic constraints of `m` simulated
+        replications at a solution and update its summary statistics.
+
+        Parameters
+        ----------
+        solution : ``base.Solution``
+            Solution at which the replications were simulated.
+        batch_responses : dict [numpy array]
+            Performance measures of interest; first axis indexes replications.
+        m : int
+            Number of replications simulated.
+        """
+        if self.objective_response_map is not None and (self.n_stochastic_constraints == 0 or self.stoch_constraint_response_map is not None):
+            # Convert the whole batch of responses to objectives and
+            # stochastic constraints with array operations.
+            solution.objectives[solution.n_reps:solution.n_reps + m] = self.batch_responses_to_columns(batch_responses, self.objective_response_map, solution.det_objectives)
+            if self.n_stochastic_constraints > 0:
+                solution.stoch_constraints[solution.n_reps:solution.n_reps + m] = self.batch_responses_to_columns(batch_responses, self.stoch_constraint_response_map, solution.det_stoch_constraints)
+            solution.n_reps += m
+        else:
+            for rep in range(m):
+                responses = {key: values[rep] for key, values in batch_responses.items()}
                 # Convert gradient subdictionaries to vectors mapping to decision variables.
                 # TEMPORARILY COMMENT OUT GRADIENTS
                 # vector_gradients = {keys: self.factor_dict_to_vector(gradient_dict) for (keys, gradient_dict) in gradients.items()}
@@ -587,15 +826,42 @@ class Problem(object):
                     # solution.stoch_constraints_gradients[solution.n_reps] = [[sum(pairs) for pairs in zip(stoch_stoch_cons, det_stoch_cons)] for stoch_stoch_cons, det_stoch_cons in zip(self.response_dict_to_stoch_constraints(vector_gradients), solution.det_stoch_constraints_gradients)]
                 # Increment counter.
                 solution.n_reps += 1
-                # Advance rngs to start of next subsubstream.
-                for rng in solution.rng_list:
-                    rng.advance_subsubstream()
-            # Update summary statistics.
-            solution.recompute_summary_statistics()
+        # Update summary statistics.
+        solution.update_summary_statistics(m)
+
+    def batch_responses_to_columns(self, batch_responses, response_map, det_values):
+        """Convert responses from a batch of replications to objectives or
+        LHSs of stochastic constraints.
+
+        Parameters
+        ----------
+        batch_responses : dict [numpy array]
+            Performance measures of interest, one entry per replication.
+        response_map : tuple [dict]
+            For each column, coefficients of the responses it sums.
+        det_values : tuple
+            Deterministic component added to each column.
+
+        Returns
+        -------
+        columns : numpy array
+            Objectives or LHSs of stochastic constraints; # replications x # columns.
+        """
+        m = len(next(iter(batch_responses.values())))
+        columns = np.empty((m, len(response_map)))
+        for col, (coefficients, det_value) in enumerate(zip(response_map, det_values)):
+            columns[:, col] = sum(coefficient * np.asarray(batch_responses[key]) for key, coefficient in coefficients.items()) + det_value
+        return columns
 
     def simulate_up_to(self, solutions, n_reps):
         """Simulate a set of solutions up to a given number of replications.
 
+        Notes
+        -----
+        With an attached executor, the replications of all solutions are
+        submitted as one batch of work. Results are identical to simulating
+        the solutions one at a time.
+
         Parameters
         ----------
         solutions : set
@@ -603,11 +869,35 @@ class Problem(object):
         n_reps : int
             Common number of replications to simulate each solution up to.
         """
-        for solution in solutions:
-            # If more replications needed, take them.
-            if solution.n_reps < n_reps:
-                n_reps_to_take = n_reps - solution.n_reps
-                self.simulate(solution=solution, m=n_reps_to_take)
+        if self.executor is None:
+            for solution in solutions:
+                # If more replications needed, take them.
+                if solution.n_reps < n_reps:
+                    n_reps_to_take = n_reps - solution.n_reps
+                    self.simulate(solution=solution, m=n_reps_to_take)
+        else:
+            # Submit the replications of all solutions before collecting any,
+            # so replications at different solutions run concurrently.
+            # A solution listed more than once is only submitted once.
+            work = []
+            submitted = set()
+            for solution in solutions:
+                if solution.n_reps < n_reps and id(solution) not in submitted:
+                    submitted.add(id(solution))
+                    n_reps_to_take = n_reps - solution.n_reps
+                    if solution.n_reps + n_reps_to_take > solution.storage_size:
+                        solution.pad_storage(n_reps_to_take)
+                    # Each solution gets its own copy of the model at its decision factors.
+                    self.model.factors.update(solution.decision_factors)
+                    model = deepcopy(self.model)
+                    chunk_size = self.chunk_size
+                    if chunk_size is None:
+                        chunk_size = int(np.ceil(n_reps_to_take / (os.cpu_count() or 1)))
+                    futures = self.submit_replications(self.executor, model, solution.rng_list, n_reps_to_take, chunk_size)
+                    work.append((solution, futures, n_reps_to_take))
+            for solution, futures, n_reps_to_take in work:
+                batch_responses, _ = self.collect_replications(futures, solution.rng_list, n_reps_to_take)
+                self.record_replications(solution, batch_responses, n_reps_to_take)
 
 
 class Model(object):
@@ -727,6 +1017,44 @@ class Model(object):
         """
         raise NotImplementedError
 
+    def replicate_batch(self, rng_list, m):
+        """Simulate `m` replications for the current model factors,
+        each starting at the beginning of a new subsubstream.
+
+        Notes
+        -----
+        Subclasses of ``base.Model`` can override this method to simulate
+        the replications together. The default implementation calls
+        ``replicate`` once per replication. Either way, the rngs are left
+        at the start of the subsubstream following the last replication.
+
+        Parameters
+        ----------
+        rng_list : list [``rng.MRG32k3a``]
+            RNGs for model to use when simulating the replications.
+        m : int
+            Number of replications to simulate.
+
+        Returns
+        -------
+        responses : dict [numpy array]
+            Performance measures of interest; first axis indexes replications.
+        gradients : dict [dict [numpy array]]
+            Gradient estimate for each response; first axis indexes replications.
+        """
+        response_list = []
+        gradient_list = []
+        for _ in range(m):
+            rep_responses, rep_gradients = self.replicate(rng_list)
+            response_list.append(rep_responses)
+            gradient_list.append(rep_gradients)
+            # Advance rngs to start of next subsubstream.
+            for rng in rng_list:
+                rng.advance_subsubstream()
+        responses = {response_key: np.array([rep_responses[response_key] for rep_responses in response_list]) for response_key in response_list[0]}
+        gradients = {response_key: {factor_key: np.array([rep_gradients[response_key][factor_key] for rep_gradients in gradient_list]) for factor_key in gradient_list[0][response_key]} for response_key in gradient_list[0]}
+        return responses, gradients
+
 
 class Solution(object):
     """Base class for solutions represented as vectors of decision variables
@@ -742,6 +1070,9 @@ class Solution(object):
         Decision factor names and values.
     rng_list : list [``rng.MRG32k3a``]
         RNGs for model to use when running replications at the solution.
+    rng_snapshots : list [tuple]
+        Compact states of copied RNGs not yet materialized into ``rng_list``,
+        or None.
     n_reps : int
         Number of replications run at the solution.
     det_objectives : tuple
@@ -762,12 +1093,20 @@ class Solution(object):
     objectives_gradients : numpy array
         Gradient estimates of objective(s) from each replication;
         # replications x # objectives x dimension.
+        None if gradients are not stored.
     stochastic_constraints : numpy array
         Stochastic constraint estimates from each replication;
         # replications x # stochastic constraints.
     stochastic_constraints_gradients : numpy array
         Gradient estimates of stochastic constraints from each replication;
         # replications x # stochastic constraints x dimension.
+        None if gradients are not stored.
+    objectives_comoment : numpy array
+        Running sum of cross-products of deviations of objectives from their
+        mean; # objectives x # objectives.
+    stoch_constraints_comoment : numpy array
+        Running sum of cross-products of deviations of stochastic constraints
+        from their mean; # stochastic constraints x # stochastic constraints.
 
 
     Parameters
@@ -776,26 +1115,55 @@ class Solution(object):
         Vector of decision variables.
     problem : ``base.Problem`` object
         Problem to which `x` is a solution.
+    expected_reps : int, optional
+        Expected number of replications, used to size the initial storage.
+    store_gradients : bool, default=False
+        True if storage for gradient estimates should be allocated, otherwise False.
     """
-    def __init__(self, x, problem):
+    # Solvers create many solutions, so avoid a per-instance __dict__.
+    __slots__ = ("x", "dim", "decision_factors", "_rng_list", "rng_snapshots", "n_reps",
+                 "det_objectives", "det_objectives_gradients",
+                 "det_stoch_constraints", "det_stoch_constraints_gradients",
+                 "storage_size", "objectives", "objectives_gradients",
+                 "stoch_constraints", "stoch_constraints_gradients",
+                 "objectives_comoment", "stoch_constraints_comoment",
+                 "objectives_mean", "objectives_var", "objectives_stderr", "objectives_cov",
+                 "stoch_constraints_mean", "stoch_constraints_var", "stoch_constraints_stderr", "stoch_constraints_cov")
+
+    def __init__(self, x, problem, expected_reps=None, store_gradients=False):
         super().__init__()
         self.x = x
         self.dim = len(x)
         self.decision_factors = problem.vector_to_factor_dict(x)
+        self._rng_list = None
+        self.rng_snapshots = None
         self.n_reps = 0
         self.det_objectives, self.det_objectives_gradients = problem.deterministic_objectives_and_gradients(self.x)
         self.det_stoch_constraints, self.det_stoch_constraints_gradients = problem.deterministic_stochastic_constraints_and_gradients(self.x)
-        init_size = 100  # Initialize numpy arrays to store up to 100 replications.
+        if expected_reps is None:
+            init_size = 100  # Initialize numpy arrays to store up to 100 replications.
+        else:
+            init_size = max(expected_reps, 1)
         self.storage_size = init_size
         # Raw data.
         self.objectives = np.zeros((init_size, problem.n_objectives))
-        self.objectives_gradients = np.zeros((init_size, problem.n_objectives, problem.dim))
+        # Gradient storage is (dim) times larger, so only allocate it when needed.
+        if store_gradients:
+            self.objectives_gradients = np.zeros((init_size, problem.n_objectives, problem.dim))
+        else:
+            self.objectives_gradients = None
         if problem.n_stochastic_constraints > 0:
             self.stoch_constraints = np.zeros((init_size, problem.n_stochastic_constraints))
-            self.stoch_constraints_gradients = np.zeros((init_size, problem.n_stochastic_constraints, problem.dim))
+            if store_gradients:
+                self.stoch_constraints_gradients = np.zeros((init_size, problem.n_stochastic_constraints, problem.dim))
+            else:
+                self.stoch_constraints_gradients = None
         else:
             self.stoch_constraints = None
             self.stoch_constraints_gradients = None
+        # Accumulators for incremental summary statistics.
+        self.objectives_comoment = None
+        self.stoch_constraints_comoment = None
         # Summary statistics
         # self.objectives_mean = np.full((problem.n_objectives), np.nan)
         # self.objectives_var = np.full((problem.n_objectives), np.nan)
@@ -823,41 +1191,187 @@ class Solution(object):
             List of random-number generators used to run simulation replications.
         copy : bool, default=True
             True if we want to copy the ``rng.MRG32k3a`` objects, otherwise False.
+            Copies are made when ``rng_list`` is first accessed.
         """
         if copy:
-            self.rng_list = [deepcopy(rng) for rng in rng_list]
+            # Defer copying until the rngs are first used; many solutions
+            # are created but never simulated.
+            self._rng_list = None
+            self.rng_snapshots = [(type(rng), rng.snapshot()) for rng in rng_list]
         else:
             self.rng_list = rng_list
 
+    @property
+    def rng_list(self):
+        """RNGs for model to use when running replications at the solution;
+        copied RNGs are materialized on first access.
+        """
+        if self._rng_list is None and self.rng_snapshots is not None:
+            self._rng_list = [cls.restore(snapshot) for cls, snapshot in self.rng_snapshots]
+            self.rng_snapshots = None
+        if self._rng_list is None:
+            raise AttributeError("No rngs are attached to the solution.")
+        return self._rng_list
+
+    @rng_list.setter
+    def rng_list(self, rng_list):
+        self._rng_list = rng_list
+        self.rng_snapshots = None
+
     def pad_storage(self, m):
-        """Append zeros to numpy arrays for summary statistics.
+        """Enlarge numpy arrays for raw data to hold `m` more replications.
+
+        Notes
+        -----
+        A request for at least as many replications as the storage holds
+        reserves exactly `n_reps` + `m` rows. Smaller requests at least double
+        the storage, so the cost of copying stored replications is amortized
+        over replications either way.
 
         Parameters
         ----------
         m : int
             Number of replications to simulate.
         """
-        # Size of data storage.
-        n_objectives = len(self.det_objectives)
-        base_pad_size = 100
-        # Default is to append space for 100 more replications.
-        # If more space needed, append in multiples of 100.
-        pad_size = int(np.ceil(m / base_pad_size)) * base_pad_size
-        self.storage_size += pad_size
-        self.objectives = np.concatenate((self.objectives, np.zeros((pad_size, n_objectives))))
-        self.objectives_gradients = np.concatenate((self.objectives_gradients, np.zeros((pad_size, n_objectives, self.dim))))
+        if m >= self.storage_size:
+            new_size = self.n_reps + m
+        else:
+            new_size = max(2 * self.storage_size, self.n_reps + m)
+        self.objectives = self._resized(self.objectives, new_size)
+        if self.objectives_gradients is not None:
+            self.objectives_gradients = self._resized(self.objectives_gradients, new_size)
+        if self.stoch_constraints is not None:
+            self.stoch_constraints = self._resized(self.stoch_constraints, new_size)
+        if self.stoch_constraints_gradients is not None:
+            self.stoch_constraints_gradients = self._resized(self.stoch_constraints_gradients, new_size)
+        self.storage_size = new_size
+
+    def _resized(self, array, new_size):
+        """Copy the recorded replications of a raw data array into a
+        zero-filled array with room for `new_size` replications.
+
+        Parameters
+        ----------
+        array : numpy array
+            Raw data; first axis indexes replications.
+        new_size : int
+            Number of replications the new array can hold.
+
+        Returns
+        -------
+        new_array : numpy array
+            Enlarged array.
+        """
+        new_array = np.zeros((new_size,) + array.shape[1:])
+        new_array[:self.n_reps] = array[:self.n_reps]
+        return new_array
+
+    def summarize(self):
+        """Create a lightweight summary of the solution that keeps its
+        estimates but not its raw data or RNGs.
+
+        Returns
+        -------
+        summary : ``base.SolutionSummary``
+            Summary of the solution.
+        """
+        return SolutionSummary(self)
+
+    def update_summary_statistics(self, m):
+        """Update summary statistics of the solution with the last `m`
+        recorded replications.
+
+        Notes
+        -----
+        Running means and comoments are merged with those of the new
+        replications (Welford's update when `m` = 1), so the cost does not
+        grow with the number of replications already recorded. Results agree
+        with ``recompute_summary_statistics`` up to floating-point rounding.
+
+        Parameters
+        ----------
+        m : int
+            Number of replications recorded since the last update.
+        """
+        n_old = self.n_reps - m
+        self.objectives_mean, self.objectives_comoment = self._merged_moments(self.objectives[n_old:self.n_reps], n_old, getattr(self, "objectives_mean", None), self.objectives_comoment)
+        if self.n_reps > 1:
+            self.objectives_var, self.objectives_stderr, self.objectives_cov = self._comoment_statistics(self.objectives_comoment)
         if self.stoch_constraints is not None:
-            n_stochastic_constraints = len(self.det_stoch_constraints)
-            self.stoch_constraints = np.concatenate((self.stoch_constraints, np.zeros((pad_size, n_stochastic_constraints))))
-            self.stoch_constraints_gradients = np.concatenate((self.stoch_constraints_gradients, np.zeros((pad_size, n_stochastic_constraints, self.dim))))
+            self.stoch_constraints_mean, self.stoch_constraints_comoment = self._merged_moments(self.stoch_constraints[n_old:self.n_reps], n_old, getattr(self, "stoch_constraints_mean", None), self.stoch_constraints_comoment)
+            self.stoch_constraints_var, self.stoch_constraints_stderr, self.stoch_constraints_cov = self._comoment_statistics(self.stoch_constraints_comoment)
+
+    def _merged_moments(self, batch, n_old, mean, comoment):
+        """Merge the mean and comoment of a batch of replications into those
+        of the `n_old` replications recorded before it.
+
+        Parameters
+        ----------
+        batch : numpy array
+            New replications; # new replications x # outputs.
+        n_old : int
+            Number of replications summarized by `mean` and `comoment`.
+        mean : numpy array
+            Mean of the previous replications.
+        comoment : numpy array
+            Comoment of the previous replications.
+
+        Returns
+        -------
+        new_mean : numpy array
+            Mean of all replications.
+        new_comoment : numpy array
+            Comoment of all replications.
+        """
+        m = batch.shape[0]
+        batch_mean = np.mean(batch, axis=0)
+        deviations = batch - batch_mean
+        batch_comoment = deviations.T @ deviations
+        if n_old == 0:
+            return batch_mean, batch_comoment
+        n = n_old + m
+        delta = batch_mean - mean
+        new_mean = mean + delta * (m / n)
+        new_comoment = comoment + batch_comoment + np.outer(delta, delta) * (n_old * m / n)
+        return new_mean, new_comoment
+
+    def _comoment_statistics(self, comoment):
+        """Compute sample variances, standard errors, and covariances from a
+        comoment.
+
+        Parameters
+        ----------
+        comoment : numpy array
+            Comoment of all recorded replications.
+
+        Returns
+        -------
+        var : numpy array
+            Sample variances.
+        stderr : numpy array
+            Standard errors of the sample means.
+        cov : numpy array
+            Sample covariance matrix (a scalar array for a single output,
+            as from ``np.cov``).
+        """
+        with np.errstate(divide="ignore", invalid="ignore"):
+            cov = comoment / (self.n_reps - 1)
+        var = np.diag(cov).copy()
+        stderr = np.sqrt(var) / np.sqrt(self.n_reps)
+        return var, stderr, np.squeeze(cov)
 
     def recompute_summary_statistics(self):
-        """Recompute summary statistics of the solution.
+        """Recompute summary statistics of the solution from all recorded
+        replications.
 
         Notes
         -----
         Statistics for gradients of objectives and stochastic constraint LHSs
         are temporarily commented out. Under development.
+
+        ``Problem.simulate`` uses ``update_summary_statistics`` instead; this
+        method is kept to verify the incremental statistics and resets the
+        running accumulators to the recomputed values.
         """
         self.objectives_mean = np.mean(self.objectives[:self.n_reps], axis=0)
         if self.n_reps > 1:
@@ -879,3 +1393,135 @@ class Solution(object):
             # self.stoch_constraints_gradients_var = np.var(self.stoch_constraints_gradients[:self.n_reps], axis=0, ddof=1)
             # self.stoch_constraints_gradients_stderr = np.std(self.stoch_constraints_gradients[:self.n_reps], axis=0, ddof=1) / np.sqrt(self.n_reps)
             # self.stoch_constraints_gradients_cov = np.array([np.cov(self.stoch_constraints_gradients[:self.n_reps, stcon], rowvar=False, ddof=1) for stcon in range(len(self.det_stoch_constraints))])
+        # Reset accumulators for incremental updates.
+        deviations = self.objectives[:self.n_reps] - self.objectives_mean
+        self.objectives_comoment = deviations.T @ deviations
+        if self.stoch_constraints is not None:
+            deviations = self.stoch_constraints[:self.n_reps] - self.stoch_constraints_mean
+            self.stoch_constraints_comoment = deviations.T @ deviations
+
+
+class SolutionSummary(object):
+    """Summary of a simulated solution for solvers that no longer need its
+    raw replications, e.g., formerly recommended solutions.
+
+    Attributes
+    ----------
+    x : tuple
+        Vector of decision variables.
+    n_reps : int
+        Number of replications run at the solution.
+    objectives_mean : numpy array
+        Sample means of the objectives.
+    objectives_var : numpy array
+        Sample variances of the objectives.
+    stoch_constraints_mean : numpy array
+        Sample means of the LHSs of the stochastic constraints.
+    stoch_constraints_var : numpy array
+        Sample variances of the LHSs of the stochastic constraints.
+
+    Parameters
+    ----------
+    solution : ``base.Solution``
+        Solution to summarize.
+    """
+    __slots__ = ("x", "n_reps", "objectives_mean", "objectives_var", "stoch_constraints_mean", "stoch_constraints_var")
+
+    def __init__(self, solution):
+        self.x = solution.x
+        self.n_reps = solution.n_reps
+        self.objectives_mean = getattr(solution, "objectives_mean", None)
+        self.objectives_var = getattr(solution, "objectives_var", None)
+        self.stoch_constraints_mean = getattr(solution, "stoch_constraints_mean", None)
+        self.stoch_constraints_var = getattr(solution, "stoch_constraints_var", None)
+
+
+class SolutionCache(object):
+    """Least-recently-used cache of solutions keyed by decision variables
+    and the positions of the RNGs from which they were created.
+
+    Attributes
+    ----------
+    max_size : int
+        Max number of solutions held in the cache.
+    solutions : collections.OrderedDict
+        Cached solutions, ordered from least to most recently used.
+    hits : int
+        Number of lookups that found a cached solution.
+    misses : int
+        Number of lookups that did not find a cached solution.
+
+    Parameters
+    ----------
+    max_size : int
+        Max number of solutions held in the cache.
+    """
+    def __init__(self, max_size):
+        self.max_size = max_size
+        self.solutions = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.solutions)
+
+    def key(self, x, rng_list):
+        """Build the cache key of a solution.
+
+        Parameters
+        ----------
+        x : tuple
+            Vector of decision variables.
+        rng_list : list [``rng.MRG32k3a``]
+            RNGs from which the solution's RNGs are copied.
+
+        Returns
+        -------
+        key : tuple
+            Decision variables and the stream indices and states of the RNGs.
+        """
+        return (tuple(x), tuple((tuple(rng.s_ss_sss_index), rng.get_current_state()) for rng in rng_list))
+
+    def get(self, key):
+        """Look up a solution, marking it as most recently used.
+
+        Parameters
+        ----------
+        key : tuple
+            Cache key of the solution.
+
+        Returns
+        -------
+        solution : ``base.Solution``
+            Cached solution, or None if not found.
+        """
+        solution = self.solutions.get(key)
+        if solution is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self.solutions.move_to_end(key)
+        return solution
+
+    def put(self, key, solution):
+        """Add a solution, evicting the least recently used solution if the
+        cache is full.
+
+        Parameters
+        ----------
+        key : tuple
+            Cache key of the solution.
+        solution : ``base.Solution``
+            Solution to cache.
+        """
+        self.solutions[key] = solution
+        self.solutions.move_to_end(key)
+        if len(self.solutions) > self.max_size:
+            self.solutions.popitem(last=False)
+
+    def clear(self):
+        """Remove all cached solutions and reset the counters.
+        """
+        self.solutions.clear()
+        self.hits = 0
+        self.misses = 0
@@ -153,10 +153,15 @@ class DataFarmingExperiment(object):
         """
         # Setup random number generators for model.
         # Use stream 0 for all runs; start with substreams 0, 1, ..., model.n_rngs-1.
-        main_rng_list = [MRG32k3a(s_ss_sss_index=[0, ss, 0]) for ss in range(self.model.n_rngs)]
-        # All design points will share the same random number generator objects.
+        # If not using CRN, each design point uses the next set of substreams.
+        n_rngs = self.model.n_rngs
+        n_rng_sets = 1 if crn_across_design_pts else self.n_design_pts
+        rng_grid = MRG32k3a.spawn_grid(n_streams=1, n_substreams=n_rng_sets * n_rngs)[0]
         # Simulate n_reps replications from each design point.
-        for design_pt in self.design:
+        for dp_index, design_pt in enumerate(self.design):
+            # With CRN, all design points share the same random number generator objects.
+            rng_set = 0 if crn_across_design_pts else dp_index
+            main_rng_list = rng_grid[rng_set * n_rngs:(rng_set + 1) * n_rngs]
             # Attach random number generators.
             design_pt.attach_rngs(rng_list=main_rng_list, copy=False)
             # Simulate n_reps replications from each design point.
@@ -166,11 +171,6 @@ class DataFarmingExperiment(object):
                 # Reset rngs to start of current substream.
                 for rng in main_rng_list:
                     rng.reset_substream()
-            else:  # If not using CRN...
-                # ...advance rngs to starts of next set of substreams.
-                for rng in main_rng_list:
-                    for _ in range(len(main_rng_list)):
-                        rng.advance_substream()
 
     def print_to_csv(self, csv_filename="raw_results"):
         """
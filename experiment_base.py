@@ -458,12 +458,14 @@ class Experiment(object):
         rng2 = MRG32k3a(s_ss_sss_index=[2, 2, 0])
         rng3 = MRG32k3a(s_ss_sss_index=[2, 3, 0])
         self.solver.attach_rngs([rng1, rng2, rng3])
+        # Create RNGs used for simulating solutions on every macroreplication.
+        progenitor_rngs_grid = MRG32k3a.spawn_grid(n_streams=self.n_macroreps, n_substreams=self.problem.model.n_rngs, s_ss_sss_index=[2, 0, 0])
         # Run n_macroreps of the solver on the problem.
         # Report recommended solutions and corresponding intermediate budgets.
         for mrep in range(self.n_macroreps):
             print(f"Running macroreplication {mrep + 1} of {self.n_macroreps} of Solver {self.solver.name} on Problem {self.problem.name}.")
-            # Create, initialize, and attach RNGs used for simulating solutions.
-            progenitor_rngs = [MRG32k3a(s_ss_sss_index=[mrep + 2, ss, 0]) for ss in range(self.problem.model.n_rngs)]
+            # Attach RNGs used for simulating solutions.
+            progenitor_rngs = progenitor_rngs_grid[mrep]
             self.solver.solution_progenitor_rngs = progenitor_rngs
             # print([rng.s_ss_sss_index for rng in progenitor_rngs])
             # Run the solver on the problem.
@@ -515,7 +517,11 @@ class Experiment(object):
         # Create, initialize, and attach RNGs for model.
         # Stream 0: reserved for post-replications.
         # Skip over first set of substreams dedicated for sampling x0 and x*.
-        baseline_rngs = [MRG32k3a(s_ss_sss_index=[0, self.problem.model.n_rngs + rng_index, 0]) for rng_index in range(self.problem.model.n_rngs)]
+        # Without CRN across macroreplications, each macroreplication uses
+        # the next set of substreams = previous substreams + # of model RNGs.
+        n_rngs = self.problem.model.n_rngs
+        n_baseline_sets = 1 if crn_across_macroreps else self.n_macroreps
+        baseline_rngs_grid = MRG32k3a.spawn_grid(n_streams=1, n_substreams=n_baseline_sets * n_rngs, s_ss_sss_index=[0, n_rngs, 0])[0]
         # Initialize matrix containing
         #     all postreplicates of objective,
         #     for each macroreplication,
@@ -523,9 +529,11 @@ class Experiment(object):
         self.all_post_replicates = [[[] for _ in range(len(self.all_intermediate_budgets[mrep]))] for mrep in range(self.n_macroreps)]
         # Simulate intermediate recommended solutions.
         for mrep in range(self.n_macroreps):
+            baseline_set = 0 if crn_across_macroreps else mrep
+            baseline_rngs = baseline_rngs_grid[baseline_set * n_rngs:(baseline_set + 1) * n_rngs]
             for budget_index in range(len(self.all_intermediate_budgets[mrep])):
                 x = self.all_recommended_xs[mrep][budget_index]
-                fresh_soln = Solution(x, self.problem)
+                fresh_soln = Solution(x, self.problem, expected_reps=self.n_postreps)
                 fresh_soln.attach_rngs(rng_list=baseline_rngs, copy=False)
                 self.problem.simulate(solution=fresh_soln, m=self.n_postreps)
                 # Store results
@@ -538,12 +546,6 @@ class Experiment(object):
                 # Reset each rng to start of its current substream.
                 for rng in baseline_rngs:
                     rng.reset_substream()
-            else:
-                # Advance each rng to start of
-                #     substream = current substream + # of model RNGs.
-                for rng in baseline_rngs:
-                    for _ in range(self.problem.model.n_rngs):
-                        rng.advance_substream()
         # Store estimated objective for each macrorep for each budget.
         self.all_est_objectives = [[np.mean(self.all_post_replicates[mrep][budget_index]) for budget_index in range(len(self.all_intermediate_budgets[mrep]))] for mrep in range(self.n_macroreps)]
         # Save Experiment object to .pickle file.
@@ -832,7 +834,7 @@ def post_normalize(experiments, n_postreps_init_opt, crn_across_init_opt=True, p
     if proxy_init_val is not None:
         x0_postreps = [proxy_init_val] * n_postreps_init_opt
     else:
-        initial_soln = Solution(x0, ref_experiment.problem)
+        initial_soln = Solution(x0, ref_experiment.problem, expected_reps=n_postreps_init_opt)
         initial_soln.attach_rngs(rng_list=baseline_rngs, copy=False)
         ref_experiment.problem.simulate(solution=initial_soln, m=n_postreps_init_opt)
         x0_postreps = list(initial_soln.objectives[:n_postreps_init_opt][:, 0])  # 0 <- assuming only one objective
@@ -851,7 +853,7 @@ def post_normalize(experiments, n_postreps_init_opt, crn_across_init_opt=True, p
     elif proxy_opt_x is not None:
         xstar = proxy_opt_x
         # Take post-replications at xstar.
-        opt_soln = Solution(xstar, ref_experiment.problem)
+        opt_soln = Solution(xstar, ref_experiment.problem, expected_reps=n_postreps_init_opt)
         opt_soln.attach_rngs(rng_list=baseline_rngs, copy=False)
         ref_experiment.problem.simulate(solution=opt_soln, m=n_postreps_init_opt)
         xstar_postreps = list(opt_soln.objectives[:n_postreps_init_opt][:, 0])  # 0 <- assuming only one objective
@@ -863,7 +865,7 @@ def post_normalize(experiments, n_postreps_init_opt, crn_across_init_opt=True, p
     elif ref_experiment.problem.optimal_solution is not None:
         xstar = ref_experiment.problem.optimal_solution
         # Take post-replications at xstar.
-        opt_soln = Solution(xstar, ref_experiment.problem)
+        opt_soln = Solution(xstar, ref_experiment.problem, expected_reps=n_postreps_init_opt)
         opt_soln.attach_rngs(rng_list=baseline_rngs, copy=False)
         ref_experiment.problem.simulate(solution=opt_soln, m=n_postreps_init_opt)
         xstar_postreps = list(opt_soln.objectives[:n_postreps_init_opt][:, 0])  # 0 <- assuming only one objective
@@ -887,7 +889,7 @@ def post_normalize(experiments, n_postreps_init_opt, crn_across_init_opt=True, p
         best_budget_idx = np.argmax(experiment.problem.minmax[0] * np.array(best_experiment.all_est_objectives[best_mrep]))
         xstar = best_experiment.all_recommended_xs[best_mrep][best_budget_idx]
         # Take post-replications at x*.
-        opt_soln = Solution(xstar, ref_experiment.problem)
+        opt_soln = Solution(xstar, ref_experiment.problem, expected_reps=n_postreps_init_opt)
         opt_soln.attach_rngs(rng_list=baseline_rngs, copy=False)
         ref_experiment.problem.simulate(solution=opt_soln, m=n_postreps_init_opt)
         xstar_postreps = list(opt_soln.objectives[:n_postreps_init_opt][:, 0])  # 0 <- assuming only one objective
@@ -239,6 +239,8 @@ class ChessAvgDifference(Problem):
         self.dim = 1
         self.n_objectives = 1
         self.n_stochastic_constraints = 1
+        self.objective_response_map = ({"avg_diff": 1},)
+        self.stoch_constraint_response_map = ({"avg_wait_time": 1},)
         self.minmax = (-1,)
         self.constraint_type = "stochastic"
         self.variable_type = "continuous"
@@ -165,6 +165,64 @@ class CntNV(Model):
         gradients["profit"]["order_quantity"] = grad_profit_order_quantity
         return responses, gradients
 
+    def replicate_batch(self, rng_list, m):
+        """
+        Simulate `m` replications for the current model factors,
+        each starting at the beginning of a new subsubstream.
+
+        Arguments
+        ---------
+        rng_list : list of rng.MRG32k3a objects
+            rngs for model to use when simulating the replications
+        m : int
+            number of replications to simulate
+
+        Returns
+        -------
+        responses : dict of numpy arrays
+            performance measures of interest, one entry per replication
+        gradients : dict of dicts of numpy arrays
+            gradient estimates for each response, one entry per replication
+
+        See also
+        --------
+        base.Model.replicate_batch
+        """
+        # Draw the demand uniform of every replication in one step,
+        # one lane per replication.
+        demand_lanes = rng_list[0].subsubstream_lanes(m)
+        u = demand_lanes.random()
+        # Generate random demands according to Burr Type XII distribution.
+        # Powers are taken with Python floats so demands match ``replicate`` exactly.
+        inv_k = -1 / self.factors["Burr_k"]
+        exponent = (1 / self.factors["Burr_c"])
+        demand = np.array([((1 - u_rep)**inv_k - 1)**exponent for u_rep in u.tolist()])
+        # Calculate profits.
+        order_quantity = self.factors["order_quantity"]
+        order_cost = (self.factors["purchase_price"]
+                      * order_quantity)
+        sales_revenue = (np.minimum(demand, order_quantity)
+                         * self.factors["sales_price"])
+        salvage_revenue = (np.maximum(0, order_quantity - demand)
+                           * self.factors["salvage_price"])
+        profit = sales_revenue + salvage_revenue - order_cost
+        stockout_qty = np.maximum(demand - order_quantity, 0)
+        stockout = (stockout_qty > 0).astype(int)
+        # Calculate gradients of profit w.r.t. order quantity.
+        grad_profit_order_quantity = np.where(demand > order_quantity,
+                                              self.factors["sales_price"] - self.factors["purchase_price"],
+                                              np.where(demand < order_quantity,
+                                                       self.factors["salvage_price"] - self.factors["purchase_price"],
+                                                       np.nan))
+        # Compose responses and gradients.
+        responses = {"profit": profit, "stockout_qty": stockout_qty, "stockout": stockout}
+        gradients = {response_key:
+                     {factor_key: np.full(m, np.nan) for factor_key in self.specifications}
+                     for response_key in responses
+                     }
+        gradients["profit"]["order_quantity"] = grad_profit_order_quantity
+        return responses, gradients
+
 
 """
 Summary
@@ -247,6 +305,7 @@ class CntNVMaxProfit(Problem):
         self.dim = 1
         self.n_objectives = 1
         self.n_stochastic_constraints = 0
+        self.objective_response_map = ({"profit": 1},)
         self.minmax = (1,)
         self.constraint_type = "box"
         self.variable_type = "continuous"
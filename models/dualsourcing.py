@@ -215,10 +215,18 @@ class DualSourcing(Model):
         """
         # Designate random number generators.
         demand_rng = rng_list[0]
-        # Vectors of regular orders to be received in periods n through n + lr - 1.
-        orders_reg = np.zeros(self.factors["lead_reg"])
-        # Vectors of expedited orders to be received in periods n through n + le - 1.
-        orders_exp = np.zeros(self.factors["lead_exp"])
+        lead_exp = self.factors["lead_exp"]
+        lead_reg = self.factors["lead_reg"]
+        # Circular buffers of expedited and regular orders, indexed by the
+        # period in which they will be received modulo the buffer size.
+        orders_exp = [0.0] * (lead_exp + 1)
+        orders_reg = [0.0] * (lead_reg + 1)
+        # Running sums of expedited orders to be received in periods n through n + le - 1,
+        # and of regular orders to be received in periods n through n + le - 1
+        # and n through n + lr - 1.
+        pipeline_exp = 0.0
+        pipeline_reg_near = 0.0
+        pipeline_reg = 0.0
 
         # Generate demand.
         demand = [round(max(0, demand_rng.normalvariate(mu=self.factors["mu"], sigma=self.factors["st_dev"]))) for _ in range(self.factors["n_days"])]
@@ -232,17 +240,24 @@ class DualSourcing(Model):
         # Run simulation over time horizon.
         for day in range(self.factors["n_days"]):
             # Calculate inventory positions.
-            inv_position_exp = round(inv + np.sum(orders_exp) + np.sum(orders_reg[:self.factors["lead_exp"]]))
-            inv_position_reg = round(inv + np.sum(orders_exp) + np.sum(orders_reg))
+            inv_position_exp = round(inv + pipeline_exp + pipeline_reg_near)
+            inv_position_reg = round(inv + pipeline_exp + pipeline_reg)
             # Place orders if needed.
-            orders_exp = np.append(orders_exp, max(0, round(self.factors["order_level_exp"] - inv_position_exp - orders_reg[self.factors["lead_exp"]])))
-            orders_reg = np.append(orders_reg, (self.factors["order_level_reg"] - inv_position_reg - orders_exp[self.factors["lead_exp"]]))
+            reg_due_exp = orders_reg[(day + lead_exp) % (lead_reg + 1)]
+            new_order_exp = max(0, round(self.factors["order_level_exp"] - inv_position_exp - reg_due_exp))
+            new_order_reg = (self.factors["order_level_reg"] - inv_position_reg - new_order_exp)
+            orders_exp[(day + lead_exp) % (lead_exp + 1)] = new_order_exp
+            orders_reg[(day + lead_reg) % (lead_reg + 1)] = new_order_reg
             # Charge ordering cost.
-            total_ordering_cost[day] = self.factors["cost_exp"] * orders_exp[self.factors["lead_exp"]] + self.factors["cost_reg"] * orders_reg[self.factors["lead_reg"]]
+            total_ordering_cost[day] = self.factors["cost_exp"] * new_order_exp + self.factors["cost_reg"] * new_order_reg
             # Orders arrive, update on-hand inventory.
-            inv = inv + orders_exp[0] + orders_reg[0]
-            orders_exp = np.delete(orders_exp, 0)
-            orders_reg = np.delete(orders_reg, 0)
+            arrived_exp = orders_exp[day % (lead_exp + 1)]
+            arrived_reg = orders_reg[day % (lead_reg + 1)]
+            inv = inv + arrived_exp + arrived_reg
+            # Shift the pipelines by one period.
+            pipeline_exp = pipeline_exp + new_order_exp - arrived_exp
+            pipeline_reg_near = pipeline_reg_near + reg_due_exp - arrived_reg
+            pipeline_reg = pipeline_reg + new_order_reg - arrived_reg
             # Satisfy or backorder demand.
             # dn = max(0, demand[day]) THIS IS DONE TWICE
             # inv = inv - dn
@@ -259,6 +274,76 @@ class DualSourcing(Model):
         gradients = {response_key: {factor_key: np.nan for factor_key in self.specifications} for response_key in responses}
         return responses, gradients
 
+    def replicate_batch(self, rng_list, m):
+        """
+        Simulate `m` replications for the current model factors,
+        each starting at the beginning of a new subsubstream.
+
+        Arguments
+        ---------
+        rng_list : [list]  [rng.mrg32k3a.MRG32k3a]
+            rngs for model to use when simulating the replications
+        m : int
+            number of replications to simulate
+
+        Returns
+        -------
+        responses : dict of numpy arrays
+            performance measures of interest, one entry per replication
+        gradients : dict of dicts of numpy arrays
+            gradient estimates for each response, one entry per replication
+
+        See also
+        --------
+        base.Model.replicate_batch
+        """
+        n_days = self.factors["n_days"]
+        lead_exp = self.factors["lead_exp"]
+        lead_reg = self.factors["lead_reg"]
+        # Generate demands of all replications; row r holds replication r.
+        demand_lanes = rng_list[0].subsubstream_lanes(m)
+        demand = np.empty((m, n_days))
+        for day in range(n_days):
+            demand[:, day] = np.round(np.maximum(0, demand_lanes.normalvariate(mu=self.factors["mu"], sigma=self.factors["st_dev"])))
+        # Circular buffers and running pipeline sums, as in ``replicate``,
+        # with one column (or entry) per replication.
+        orders_exp = np.zeros((lead_exp + 1, m))
+        orders_reg = np.zeros((lead_reg + 1, m))
+        pipeline_exp = np.zeros(m)
+        pipeline_reg_near = np.zeros(m)
+        pipeline_reg = np.zeros(m)
+        # Track total expenses.
+        total_holding_cost = np.zeros((m, n_days))
+        total_penalty_cost = np.zeros((m, n_days))
+        total_ordering_cost = np.zeros((m, n_days))
+        inv = np.full(m, self.factors["initial_inv"], dtype=float)
+        # Run simulation over time horizon for all replications at once.
+        for day in range(n_days):
+            inv_position_exp = np.round(inv + pipeline_exp + pipeline_reg_near)
+            inv_position_reg = np.round(inv + pipeline_exp + pipeline_reg)
+            reg_due_exp = orders_reg[(day + lead_exp) % (lead_reg + 1)].copy()
+            new_order_exp = np.maximum(0, np.round(self.factors["order_level_exp"] - inv_position_exp - reg_due_exp))
+            new_order_reg = (self.factors["order_level_reg"] - inv_position_reg - new_order_exp)
+            orders_exp[(day + lead_exp) % (lead_exp + 1)] = new_order_exp
+            orders_reg[(day + lead_reg) % (lead_reg + 1)] = new_order_reg
+            total_ordering_cost[:, day] = self.factors["cost_exp"] * new_order_exp + self.factors["cost_reg"] * new_order_reg
+            arrived_exp = orders_exp[day % (lead_exp + 1)]
+            arrived_reg = orders_reg[day % (lead_reg + 1)]
+            inv = inv + arrived_exp + arrived_reg
+            pipeline_exp = pipeline_exp + new_order_exp - arrived_exp
+            pipeline_reg_near = pipeline_reg_near + reg_due_exp - arrived_reg
+            pipeline_reg = pipeline_reg + new_order_reg - arrived_reg
+            inv = inv - demand[:, day]
+            total_penalty_cost[:, day] = -1 * self.factors["penalty_cost"] * np.minimum(0, inv)
+            total_holding_cost[:, day] = self.factors["holding_cost"] * np.maximum(0, inv)
+        # Calculate responses from simulation data.
+        responses = {"average_ordering_cost": np.mean(total_ordering_cost, axis=1),
+                     "average_penalty_cost": np.mean(total_penalty_cost, axis=1),
+                     "average_holding_cost": np.mean(total_holding_cost, axis=1)
+                     }
+        gradients = {response_key: {factor_key: np.full(m, np.nan) for factor_key in self.specifications} for response_key in responses}
+        return responses, gradients
+
 
 """
 Summary
@@ -337,6 +422,7 @@ class DualSourcingMinCost(Problem):
         self.dim = 2
         self.n_objectives = 1
         self.n_stochastic_constraints = 0
+        self.objective_response_map = ({"average_ordering_cost": 1, "average_penalty_cost": 1, "average_holding_cost": 1},)
         self.minmax = (-1,)
         self.constraint_type = "box"
         self.variable_type = "discrete"
@@ -138,35 +138,46 @@ class DynamNews(Model):
         """
         # Designate random number generator for generating a Gumbel random variable.
         Gumbel_rng = rng_list[0]
-        # Compute Gumbel rvs for the utility of the products.
-        gumbel = np.zeros(((self.factors["num_customer"], self.factors["num_prod"])))
-        for t in range(self.factors["num_customer"]):
-            for j in range(self.factors["num_prod"]):
-                gumbel[t][j] = Gumbel_rng.gumbelvariate(-self.factors["mu"] * np.euler_gamma, self.factors["mu"])
+        num_customer = self.factors["num_customer"]
+        num_prod = self.factors["num_prod"]
+        # Compute Gumbel rvs for the utility of the products, customer by customer.
+        gumbel = Gumbel_rng.gumbelvariates(-self.factors["mu"] * np.euler_gamma, self.factors["mu"], num_customer * num_prod).reshape(num_customer, num_prod)
         # Compute utility for each product and each customer.
-        utility = np.zeros((self.factors["num_customer"], self.factors["num_prod"] + 1))
-        for t in range(self.factors["num_customer"]):
-            for j in range(self.factors["num_prod"] + 1):
-                if j == 0:
-                    utility[t][j] = 0
-                else:
-                    utility[t][j] = self.factors["c_utility"][j - 1] + gumbel[t][j - 1]
+        # Column 0 is the no-purchase option.
+        utility = np.zeros((num_customer, num_prod + 1))
+        utility[:, 1:] = np.array(self.factors["c_utility"]) + gumbel
 
         # Initialize inventory.
         inventory = np.copy(self.factors["init_level"])
-        itembought = np.zeros(self.factors["num_customer"])
-
-        # Loop through customers
-        for t in range(self.factors["num_customer"]):
-            instock = np.where(inventory > 0)[0]
-            # Initialize the purchase option to be no-purchase.
-            itembought[t] = 0
-            # Assign the purchase option to be the product that maximizes the utility.
-            for j in instock:
-                if utility[t][j + 1] > utility[t][int(itembought[t])]:
-                    itembought[t] = j + 1
-            if itembought[t] != 0:
-                inventory[int(itembought[t] - 1)] -= 1
+        # Products that start out of stock can never be chosen.
+        utility[:, 1:][:, inventory <= 0] = -np.inf
+        # Each customer chooses the available option that maximizes the utility,
+        # with ties going to the lowest index (no-purchase first).
+        itembought = np.argmax(utility, axis=1)
+
+        # Choices stay valid until a product stocks out. Jump from one stockout to the next,
+        # and only then remove the product and re-choose for the customers who wanted it.
+        start = 0
+        while start < num_customer:
+            choices = itembought[start:]
+            # Position (relative to start) at which each product sells its last unit.
+            stockout_time = num_customer
+            stockout_prod = 0
+            for j in np.flatnonzero(inventory > 0):
+                buyers = np.flatnonzero(choices == j + 1)
+                last_unit = int(np.ceil(inventory[j])) - 1
+                if last_unit < len(buyers) and buyers[last_unit] < stockout_time:
+                    stockout_time = buyers[last_unit]
+                    stockout_prod = j + 1
+            end = start + stockout_time + 1
+            inventory -= np.bincount(itembought[start:end], minlength=num_prod + 1)[1:]
+            if stockout_prod == 0:
+                break
+            # Update the in-stock set for the remaining customers.
+            utility[end:, stockout_prod] = -np.inf
+            switchers = end + np.flatnonzero(itembought[end:] == stockout_prod)
+            itembought[switchers] = np.argmax(utility[switchers], axis=1)
+            start = end
 
         # Calculate profit.
         numsold = self.factors["init_level"] - inventory
@@ -263,6 +274,7 @@ class DynamNewsMaxProfit(Problem):
         self.name = name
         self.n_objectives = 1
         self.n_stochastic_constraints = 0
+        self.objective_response_map = ({"profit": 1},)
         self.minmax = (1,)
         self.constraint_type = "box"
         self.variable_type = "discrete"
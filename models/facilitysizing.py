@@ -235,6 +235,8 @@ class FacilitySizingTotalCost(Problem):
         self.dim = 3
         self.n_objectives = 1
         self.n_stochastic_constraints = 1
+        self.objective_response_map = ({},)
+        self.stoch_constraint_response_map = ({"stockout_flag": 1},)
         self.minmax = (-1,)
         self.constraint_type = "stochastic"
         self.variable_type = "continuous"
@@ -257,6 +257,7 @@ class FixedSANLongestPath(Problem):
         self.name = name
         self.n_objectives = 1
         self.n_stochastic_constraints = 0
+        self.objective_response_map = ({"longest_path_length": 1},)
         self.minmax = (-1,)
         self.constraint_type = "box"
         self.variable_type = "continuous"
@@ -307,6 +307,7 @@ class HotelRevenue(Problem):
         self.name = name
         self.n_objectives = 1
         self.n_stochastic_constraints = 0
+        self.objective_response_map = ({"revenue": 1},)
         self.minmax = (1,)
         self.constraint_type = "box"
         self.variable_type = "discrete"
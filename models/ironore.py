@@ -338,6 +338,7 @@ class IronOreMaxRev(Problem):
         self.dim = 4
         self.n_objectives = 1
         self.n_stochastic_constraints = 0
+        self.objective_response_map = ({"total_profit": 1},)
         self.minmax = (1,)
         self.constraint_type = "box"
         self.variable_type = "mixed"
@@ -602,6 +603,7 @@ class IronOreMaxRevCnt(Problem):
         self.dim = 3
         self.n_objectives = 1
         self.n_stochastic_constraints = 0
+        self.objective_response_map = ({"total_profit": 1},)
         self.minmax = (1,)
         self.constraint_type = "box"
         self.variable_type = "continuous"
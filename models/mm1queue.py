@@ -123,71 +123,133 @@ class MM1Queue(Model):
         arrival_rng = rng_list[0]
         service_rng = rng_list[1]
         # Generate all interarrival and service times up front.
-        arrival_times = ([arrival_rng.expovariate(self.factors["lambda"])
-                         for _ in range(total)])
-        service_times = ([service_rng.expovariate(self.factors["mu"])
-                         for _ in range(total)])
-        # Create matrix storing times and metrics for each customer:
-        #     column 0 : arrival time to queue;
-        #     column 1 : service time;
-        #     column 2 : service completion time;
-        #     column 3 : sojourn time;
-        #     column 4 : waiting time;
-        #     column 5 : number of customers in system at arrival;
-        #     column 6 : IPA gradient of sojourn time w.r.t. mu;
-        #     column 7 : IPA gradient of waiting time w.r.t. mu;
-        #     column 8 : IPA gradient of sojourn time w.r.t. lambda;
-        #     column 9 : IPA gradient of waiting time w.r.t. lambda.
-        cust_mat = np.zeros((total, 10))
-        cust_mat[:, 0] = np.cumsum(arrival_times)
-        cust_mat[:, 1] = service_times
-        # Input entries for first customer's queueing experience.
-        cust_mat[0, 2] = cust_mat[0, 0] + cust_mat[0, 1]
-        cust_mat[0, 3] = cust_mat[0, 1]
-        cust_mat[0, 4] = 0
-        cust_mat[0, 5] = 0
-        cust_mat[0, 6] = -cust_mat[0, 1] / self.factors["mu"]
-        cust_mat[0, 7] = 0
-        cust_mat[0, 8] = 0
-        cust_mat[0, 9] = 0
-        # Fill in entries for remaining customers' experiences.
-        for i in range(1, total):
-            cust_mat[i, 2] = (max(cust_mat[i, 0], cust_mat[i - 1, 2])
-                              + cust_mat[i, 1])
-            cust_mat[i, 3] = cust_mat[i, 2] - cust_mat[i, 0]
-            cust_mat[i, 4] = cust_mat[i, 3] - cust_mat[i, 1]
-            cust_mat[i, 5] = (sum(cust_mat[i - int(cust_mat[i - 1, 5]) - 1:i, 2]
-                                  > cust_mat[i, 0]))
-            cust_mat[i, 6] = (-sum(cust_mat[i - int(cust_mat[i, 5]):i + 1, 1])
-                              / self.factors["mu"])
-            cust_mat[i, 7] = (-sum(cust_mat[i - int(cust_mat[i, 5]):i, 1])
-                              / self.factors["mu"])
-            cust_mat[i, 8] = np.nan  # ... to be derived
-            cust_mat[i, 9] = np.nan  # ... to be derived
-        # Compute average sojourn time and its gradient.
-        mean_sojourn_time = np.mean(cust_mat[self.factors["warmup"]:, 3])
-        grad_mean_sojourn_time_mu = np.mean(cust_mat[self.factors["warmup"]:, 6])
-        grad_mean_sojourn_time_lambda = np.mean(cust_mat[self.factors["warmup"]:, 8])
-        # Compute average waiting time and its gradient.
-        mean_waiting_time = np.mean(cust_mat[self.factors["warmup"]:, 4])
-        grad_mean_waiting_time_mu = np.mean(cust_mat[self.factors["warmup"]:, 7])
-        grad_mean_waiting_time_lambda = np.mean(cust_mat[self.factors["warmup"]:, 9])
-        # Compute fraction of customers who wait.
-        fraction_wait = np.mean(cust_mat[self.factors["warmup"]:, 5] > 0)
-        # Compose responses and gradients.
+        arrival_times = arrival_rng.expovariates(self.factors["lambda"], total)
+        service_times = service_rng.expovariates(self.factors["mu"], total)
+        batch_responses, batch_gradients = self.queue_statistics(np.array([arrival_times]), np.array([service_times]))
+        responses = {response_key: values[0] for response_key, values in batch_responses.items()}
+        gradients = {response_key: {factor_key: values[0] for factor_key, values in factor_gradients.items()}
+                     for response_key, factor_gradients in batch_gradients.items()
+                     }
+        return responses, gradients
+
+    def replicate_batch(self, rng_list, m):
+        """
+        Simulate `m` replications for the current model factors,
+        each starting at the beginning of a new subsubstream.
+
+        Arguments
+        ---------
+        rng_list : list of rng.MRG32k3a objects
+            rngs for model to use when simulating the replications
+        m : int
+            number of replications to simulate
+
+        Returns
+        -------
+        responses : dict of numpy arrays
+            performance measures of interest, one entry per replication
+        gradients : dict of dicts of numpy arrays
+            gradient estimates for each response, one entry per replication
+
+        See also
+        --------
+        base.Model.replicate_batch
+        """
+        total = self.factors["warmup"] + self.factors["people"]
+        arrival_rng = rng_list[0]
+        service_rng = rng_list[1]
+        # Generate interarrival and service times of every replication;
+        # row r holds the times of replication r.
+        arrival_times = np.zeros((m, total))
+        service_times = np.zeros((m, total))
+        for rep in range(m):
+            arrival_times[rep] = arrival_rng.expovariates(self.factors["lambda"], total)
+            service_times[rep] = service_rng.expovariates(self.factors["mu"], total)
+            # Advance rngs to start of next subsubstream.
+            for rng in rng_list:
+                rng.advance_subsubstream()
+        return self.queue_statistics(arrival_times, service_times)
+
+    def queue_statistics(self, arrival_times, service_times):
+        """
+        Compute responses and gradients of replications from their
+        interarrival and service times.
+
+        Arguments
+        ---------
+        arrival_times : numpy array
+            interarrival times; # replications x # customers
+        service_times : numpy array
+            service times; # replications x # customers
+
+        Returns
+        -------
+        responses : dict of numpy arrays
+            performance measures of interest, one entry per replication
+        gradients : dict of dicts of numpy arrays
+            gradient estimates for each response, one entry per replication
+        """
+        m, total = service_times.shape
+        warmup = self.factors["warmup"]
+        arrivals = np.cumsum(arrival_times, axis=1)
+        # Service completion times from the Lindley recursion. The recursion
+        # is evaluated customer by customer (across all replications at once)
+        # so completion times are rounded exactly as in a sequential simulation.
+        departures = np.zeros((m, total))
+        if m == 1:
+            departure = 0.0
+            row = []
+            for arrival, service in zip(arrivals[0].tolist(), service_times[0].tolist()):
+                departure = max(arrival, departure) + service
+                row.append(departure)
+            departures[0] = row
+        else:
+            departures[:, 0] = arrivals[:, 0] + service_times[:, 0]
+            for i in range(1, total):
+                departures[:, i] = np.maximum(arrivals[:, i], departures[:, i - 1]) + service_times[:, i]
+        sojourn_times = departures - arrivals
+        waiting_times = sojourn_times - service_times
+        # The first customer never waits.
+        sojourn_times[:, 0] = service_times[:, 0]
+        waiting_times[:, 0] = 0
+        # Completion times are nondecreasing, so the number of earlier
+        # customers still in system at an arrival is found by binary search.
+        n_in_system = np.zeros((m, total), dtype=int)
+        index = np.arange(total)
+        for rep in range(m):
+            n_departed = np.minimum(np.searchsorted(departures[rep], arrivals[rep], side="right"), index)
+            n_in_system[rep] = index - n_departed
+        # IPA gradients w.r.t. mu sum the service times of the customers in
+        # system at an arrival. The sums are accumulated from the earliest
+        # such customer onward, one offset at a time, so they are rounded
+        # exactly as sums taken customer by customer. Offsets beyond the
+        # customers in system add zeros ahead of the first term.
+        sum_service_times_ahead = np.zeros((m, total))
+        for offset in range(np.max(n_in_system), 0, -1):
+            shifted_service_times = np.zeros((m, total))
+            shifted_service_times[:, offset:] = service_times[:, :-offset]
+            sum_service_times_ahead = sum_service_times_ahead + np.where(n_in_system >= offset, shifted_service_times, 0)
+        grad_sojourn_times_mu = -(sum_service_times_ahead + service_times) / self.factors["mu"]
+        grad_waiting_times_mu = -sum_service_times_ahead / self.factors["mu"]
+        grad_waiting_times_mu[n_in_system == 0] = 0
+        # IPA gradients w.r.t. lambda are yet to be derived (except for the first customer).
+        grad_times_lambda = np.full((m, total), np.nan)
+        grad_times_lambda[:, 0] = 0
+        # Compute average sojourn time, average waiting time, and fraction
+        # of customers who wait, and their gradients.
         responses = {
-            "avg_sojourn_time": mean_sojourn_time,
-            "avg_waiting_time": mean_waiting_time,
-            "frac_cust_wait": fraction_wait
+            "avg_sojourn_time": np.mean(sojourn_times[:, warmup:], axis=1),
+            "avg_waiting_time": np.mean(waiting_times[:, warmup:], axis=1),
+            "frac_cust_wait": np.mean(n_in_system[:, warmup:] > 0, axis=1)
         }
         gradients = {response_key:
-                     {factor_key: np.nan for factor_key in self.specifications}
+                     {factor_key: np.full(m, np.nan) for factor_key in self.specifications}
                      for response_key in responses
                      }
-        gradients["avg_sojourn_time"]["mu"] = grad_mean_sojourn_time_mu
-        gradients["avg_sojourn_time"]["lambda"] = grad_mean_sojourn_time_lambda
-        gradients["avg_waiting_time"]["mu"] = grad_mean_waiting_time_mu
-        gradients["avg_waiting_time"]["lambda"] = grad_mean_waiting_time_lambda
+        gradients["avg_sojourn_time"]["mu"] = np.mean(grad_sojourn_times_mu[:, warmup:], axis=1)
+        gradients["avg_sojourn_time"]["lambda"] = np.mean(grad_times_lambda[:, warmup:], axis=1)
+        gradients["avg_waiting_time"]["mu"] = np.mean(grad_waiting_times_mu[:, warmup:], axis=1)
+        gradients["avg_waiting_time"]["lambda"] = np.mean(grad_times_lambda[:, warmup:], axis=1)
         return responses, gradients
 
 
@@ -268,6 +330,7 @@ class MM1MinMeanSojournTime(Problem):
         self.dim = 1
         self.n_objectives = 1
         self.n_stochastic_constraints = 0
+        self.objective_response_map = ({"avg_sojourn_time": 1},)
         self.minmax = (-1,)
         self.constraint_type = "box"
         self.variable_type = "continuous"
@@ -195,6 +195,7 @@ class ParamEstiMaxLogLik(Problem):
         self.dim = 2
         self.n_objectives = 1
         self.n_stochastic_constraints = 0
+        self.objective_response_map = ({"loglik": 1},)
         self.minmax = (1,)
         self.constraint_type = "box"
         self.variable_type = "continuous"
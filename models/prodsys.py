@@ -538,6 +538,8 @@ class ProdSysMinLeadTime(Problem):
         self.name = name
         self.n_objectives = 1
         self.n_stochastic_constraints = 1
+        self.objective_response_map = ({"avg_lead_time": 1},)
+        self.stoch_constraint_response_map = ({"service_level": -1},)
         self.minmax = (-1,)
         self.constraint_type = "stochastic"
         self.variable_type = "discrete"
@@ -274,6 +274,7 @@ class RMITDMaxRevenue(Problem):
         self.dim = 3
         self.n_objectives = 1
         self.n_stochastic_constraints = 0
+        self.objective_response_map = ({"revenue": 1},)
         self.minmax = (1,)
         self.constraint_type = "deterministic"
         self.variable_type = "discrete"
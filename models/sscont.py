@@ -206,38 +206,56 @@ class SSCont(Model):
         # Designate random number generators.
         demand_rng = rng_list[0]
         lead_rng = rng_list[1]
+        n_periods = self.factors["n_days"] + self.factors["warmup"]
+        s = self.factors["s"]
+        S = self.factors["S"]
         # Generate exponential random demands.
-        demands = [demand_rng.expovariate(1/self.factors["demand_mean"]) for _ in range(self.factors["n_days"] + self.factors["warmup"])]
+        demands = demand_rng.expovariates(1/self.factors["demand_mean"], n_periods).tolist()
         # Initialize starting and ending inventories for each period.
-        start_inv = np.zeros(self.factors["n_days"] + self.factors["warmup"])
-        start_inv[0] = self.factors["s"]  # Start with s units at period 0.
-        end_inv = np.zeros(self.factors["n_days"] + self.factors["warmup"])
+        start_inv = [0.0] * n_periods
+        start_inv[0] = s  # Start with s units at period 0.
+        end_inv = [0.0] * n_periods
         # Initialize other quantities to track:
         #   - Amount of product to be received in each period.
-        #   - Inventory position each period.
         #   - Amount of product ordered in each period.
         #   - Amount of product outstanding in each period.
-        orders_received = np.zeros(self.factors["n_days"] + self.factors["warmup"])
-        inv_pos = np.zeros(self.factors["n_days"] + self.factors["warmup"])
-        orders_placed = np.zeros(self.factors["n_days"] + self.factors["warmup"])
-        orders_outstanding = np.zeros(self.factors["n_days"] + self.factors["warmup"])
+        orders_received = [0.0] * (n_periods + 1)
+        orders_placed = [0.0] * n_periods
+        orders_outstanding = np.zeros(n_periods)
+        # Lead times are drawn in blocks of growing size as orders need them.
+        leads = []
+        lead_index = 0
+        leads_start = lead_rng.get_current_state()
         # Run simulation over time horizon.
-        for day in range(self.factors["n_days"] + self.factors["warmup"]):
+        for day in range(n_periods):
             # Calculate end-of-period inventory on hand and inventory position.
             end_inv[day] = start_inv[day] - demands[day]
-            inv_pos[day] = end_inv[day] + orders_outstanding[day]
+            inv_pos = end_inv[day] + float(orders_outstanding[day])
             # Place orders, keeping track of outstanding orders and when they will be received.
-            orders_placed[day] = np.max(((inv_pos[day] < self.factors["s"]) * (self.factors["S"] - inv_pos[day])), 0)
+            orders_placed[day] = (inv_pos < s) * (S - inv_pos)
             if orders_placed[day] > 0:
-                lead = lead_rng.poissonvariate(self.factors["lead_mean"])
-                for future_day in range(day + 1, day + lead + 1):
-                    if future_day < self.factors["n_days"] + self.factors["warmup"]:
-                        orders_outstanding[future_day] = orders_outstanding[future_day] + orders_placed[day]
-                if day + lead + 1 < self.factors["n_days"] + self.factors["warmup"]:
+                if lead_index == len(leads):
+                    leads_start = lead_rng.get_current_state()
+                    leads = lead_rng.poissonvariates(self.factors["lead_mean"], min(max(16, 2 * len(leads)), n_periods - day)).tolist()
+                    lead_index = 0
+                lead = leads[lead_index]
+                lead_index += 1
+                # The order is outstanding through day + lead and received on day + lead + 1.
+                # Adding it to all of those days at once keeps, for every day, the
+                # summation order of outstanding orders by the day they were placed.
+                orders_outstanding[day + 1:day + lead + 1] += orders_placed[day]
+                if day + lead + 1 < n_periods:
                     orders_received[day + lead + 1] = orders_received[day + lead + 1] + orders_placed[day]
             # Calculate starting inventory for next period.
-            if day < self.factors["n_days"] + self.factors["warmup"] - 1:
+            if day < n_periods - 1:
                 start_inv[day + 1] = end_inv[day] + orders_received[day + 1]
+        if lead_index < len(leads):
+            # Leave lead_rng just after the last lead time used.
+            lead_rng.seed(leads_start)
+            lead_rng.poissonvariates(self.factors["lead_mean"], lead_index)
+        start_inv = np.array(start_inv)
+        end_inv = np.array(end_inv)
+        orders_placed = np.array(orders_placed)
         # Calculate responses from simulation data.
         order_rate = np.mean(orders_placed[self.factors["warmup"]:] > 0)
         stockout_rate = np.mean(end_inv[self.factors["warmup"]:] < 0)
@@ -350,6 +368,7 @@ class SSContMinCost(Problem):
         self.dim = 2
         self.n_objectives = 1
         self.n_stochastic_constraints = 0
+        self.objective_response_map = ({"avg_backorder_costs": 1, "avg_order_costs": 1, "avg_holding_costs": 1},)
         self.minmax = (-1,)
         self.constraint_type = "box"
         self.variable_type = "continuous"
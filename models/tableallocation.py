@@ -289,6 +289,7 @@ class TableAllocationMaxRev(Problem):
         self.dim = 4
         self.n_objectives = 1
         self.n_stochastic_constraints = 0
+        self.objective_response_map = ({"total_revenue": 1},)
         self.minmax = (1,)
         self.constraint_type = "deterministic"
         self.variable_type = "discrete"
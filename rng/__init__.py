@@ -1 +1 @@
-from .mrg32k3a import MRG32k3a
+from .mrg32k3a import MRG32k3a, MRG32k3aLanes
@@ -5,6 +5,8 @@ Summary
 Useful matrix/modulus operations for mrg32k3a generator.
 """
 
+import numpy as np
+
 
 def mat33_mat31_mult(A, b):
     """Multiply a 3 x 3 matrix with a 3 x 1 matrix.
@@ -158,3 +160,35 @@ def mat33_power_mod(A, j, m):
         j = int(j / 2)
     res = B
     return res
+
+
+def mat33_mat31_mod_array(A, B, m):
+    """Compute moduli of the products of a 3 x 3 matrix with many 3 x 1 matrices.
+    Uses exact int64 arithmetic by splitting the entries of `A` into 16-bit halves,
+    so every intermediate product is less than 2**48.
+
+    Parameters
+    ----------
+    A : list [list [int]]
+        3 x 3 matrix.
+    B : numpy array [int]
+        K x 3 matrix whose rows are 3 x 1 matrices with entries in [0, m).
+    m : int
+        Modulus, less than 2**32.
+
+    Returns
+    -------
+    res : numpy array [int]
+        K x 3 matrix whose k-th row is A * B[k] mod m.
+    """
+    A = np.asarray(A, dtype=np.int64) % m
+    B = np.asarray(B, dtype=np.int64)
+    A_hi = A >> 16
+    A_lo = A & 0xFFFF
+    res = np.zeros(B.shape, dtype=np.int64)
+    for j in range(3):
+        b = B[:, j:j + 1]
+        hi = ((b * A_hi[:, j]) % m << 16) % m
+        lo = (b * A_lo[:, j]) % m
+        res = (res + hi + lo) % m
+    return res
@@ -10,10 +10,12 @@ with stream/substream/subsubstream support.
 
 import numpy as np
 import random
+import threading
 from math import log, ceil, sqrt, exp
 from copy import deepcopy
+from functools import lru_cache
 
-from .matmodops import mat33_mat31_mult, mat33_mat33_mult, mat31_mod, mat33_mod, mat33_mat33_mod, mat33_power_mod
+from .matmodops import mat33_mat31_mult, mat33_mat33_mult, mat31_mod, mat33_mod, mat33_mat33_mod, mat33_power_mod, mat33_mat31_mod_array
 
 # Constants used in mrg32k3a and in substream generation.
 # P. L'Ecuyer, ``Good Parameter Sets for Combined Multiple Recursive Random Number Generators'',
@@ -82,6 +84,24 @@ bsma = [2.50662823884, -18.61500062529, 41.39119773534, -25.44106049637]
 bsmb = [-8.47351093090, 23.08336743743, -21.06224101826, 3.13082909833]
 bsmc = [0.3374754822726147, 0.9761690190917186, 0.1607979714918209, 0.0276438810333863, 0.0038405729373609, 0.0003951896511919, 0.0000321767881768, 0.0000002888167364, 0.0000003960315187]
 
+# Jump matrices for advancing one stream, substream, or subsubstream,
+# indexed by position in the (stream, substream, subsubstream) triplet,
+# followed by the matrices for advancing a single step.
+jump_bases = ((A1p141, A2p141), (A1p94, A2p94), (A1p47, A2p47), (A1p0, A2p0))
+
+# Tables of A^(2^i) for each jump matrix A in jump_bases, extended on demand.
+# Extensions are made while holding jump_power_tables_lock, so that
+# generators used from several threads never see a duplicated power.
+jump_power_tables = ([[A1p141], [A2p141]], [[A1p94], [A2p94]], [[A1p47], [A2p47]], [[A1p0], [A2p0]])
+jump_power_tables_lock = threading.Lock()
+
+# Maximum number of recently used jump matrices kept by jump_matrices.
+jump_cache_size = 1024
+
+# Block size at which mrg32k3a_block switches from a scalar loop to
+# advancing segments of the block in lockstep.
+block_segment_threshold = 2048
+
 
 # Adapted to pure Python from the P. L'Ecuyer code referenced above.
 def mrg32k3a(state):
@@ -120,6 +140,174 @@ def mrg32k3a(state):
     return new_state, u
 
 
+def mrg32k3a_block(state, n):
+    """Generate a block of random numbers between 0 and 1 from a given state.
+    The block is identical to the output of ``n`` successive calls of ``mrg32k3a``.
+
+    Notes
+    -----
+    Short blocks are generated by a scalar loop. Long blocks are split into
+    consecutive segments whose starting states are found by jumping ahead;
+    the segments are then advanced in lockstep using integer arrays.
+
+    Parameters
+    ----------
+    state : tuple [int]
+        Current state of the generator.
+    n : int
+        Number of random numbers to generate.
+
+    Returns
+    -------
+    new_state : tuple [int]
+        State of the generator after generating ``n`` random numbers.
+    u : numpy array [float]
+        Pseudo uniform random variates.
+    """
+    if n < block_segment_threshold:
+        s10, s11, s12, s20, s21, s22 = state
+        u = np.empty(n)
+        for i in range(n):
+            p1 = (mrga12 * s11 - mrga13n * s10) % mrgm1
+            p2 = (mrga21 * s22 - mrga23n * s20) % mrgm2
+            s10, s11, s12 = s11, s12, p1
+            s20, s21, s22 = s21, s22, p2
+            if p1 <= p2:
+                u[i] = (p1 - p2 + mrgm1) * mrgnorm
+            else:
+                u[i] = (p1 - p2) * mrgnorm
+        new_state = (s10, s11, s12, s20, s21, s22)
+        return new_state, u
+    # Split the block into n_segments segments of segment_length numbers.
+    n_segments = int(sqrt(n))
+    segment_length = -(-n // n_segments)
+    A1_jump = mat33_power_mod(A1p0, segment_length, mrgm1)
+    A2_jump = mat33_power_mod(A2p0, segment_length, mrgm2)
+    # Store the last three states of each component followed by the segment.
+    x1 = np.empty((n_segments, segment_length + 3), dtype=np.int64)
+    x2 = np.empty((n_segments, segment_length + 3), dtype=np.int64)
+    st1 = list(state[0:3])
+    st2 = list(state[3:6])
+    for segment in range(n_segments):
+        x1[segment, 0:3] = st1
+        x2[segment, 0:3] = st2
+        st1 = mat31_mod(mat33_mat31_mult(A1_jump, st1), mrgm1)
+        st2 = mat31_mod(mat33_mat31_mult(A2_jump, st2), mrgm2)
+    # Advance all segments one step at a time.
+    for i in range(3, segment_length + 3):
+        x1[:, i] = (mrga12 * x1[:, i - 2] - mrga13n * x1[:, i - 3]) % mrgm1
+        x2[:, i] = (mrga21 * x2[:, i - 1] - mrga23n * x2[:, i - 3]) % mrgm2
+    p1 = x1[:, 3:].ravel()[:n]
+    p2 = x2[:, 3:].ravel()[:n]
+    # Combination.
+    diff = p1 - p2
+    u = np.where(diff <= 0, diff + mrgm1, diff) * mrgnorm
+    new_state = tuple(int(s) for s in np.concatenate((p1[-3:], p2[-3:])))
+    return new_state, u
+
+
+@lru_cache(maxsize=jump_cache_size)
+def jump_matrices(level, k):
+    """Compute the matrices that advance the generator by ``k`` streams,
+    substreams, subsubstreams, or steps.
+
+    Notes
+    -----
+    The matrix power is assembled from the precomputed powers A^(2^i) in
+    ``jump_power_tables``, one modular multiplication per nonzero bit of ``k``.
+    Recently used results are cached.
+
+    Parameters
+    ----------
+    level : int
+        0 for streams, 1 for substreams, 2 for subsubstreams, 3 for steps.
+    k : int
+        Number of streams, substreams, subsubstreams, or steps to jump.
+
+    Returns
+    -------
+    A1k : tuple [tuple [int]]
+        3 x 3 matrix advancing the first component of the state.
+    A2k : tuple [tuple [int]]
+        3 x 3 matrix advancing the second component of the state.
+    """
+    table1, table2 = jump_power_tables[level]
+    # table2 is extended after table1, so its length is a safe lower bound.
+    if len(table2) < k.bit_length():
+        with jump_power_tables_lock:
+            while len(table2) < k.bit_length():
+                table1.append(mat33_mat33_mod(table1[-1], table1[-1], mrgm1))
+                table2.append(mat33_mat33_mod(table2[-1], table2[-1], mrgm2))
+    A1k = [[1, 0, 0], [0, 1, 0], [0, 0, 1]]
+    A2k = [[1, 0, 0], [0, 1, 0], [0, 0, 1]]
+    i = 0
+    while k > 0:
+        if k & 1:
+            A1k = mat33_mat33_mod(table1[i], A1k, mrgm1)
+            A2k = mat33_mat33_mod(table2[i], A2k, mrgm2)
+        k >>= 1
+        i += 1
+    return tuple(map(tuple, A1k)), tuple(map(tuple, A2k))
+
+
+def jump_states(states, level, k=1):
+    """Advance many generator states by ``k`` streams, substreams, subsubstreams, or steps.
+
+    Parameters
+    ----------
+    states : array [int]
+        K x 6 array whose rows are states of the generator.
+    level : int
+        0 for streams, 1 for substreams, 2 for subsubstreams, 3 for steps.
+    k : int, default=1
+        Number of streams, substreams, subsubstreams, or steps to jump.
+
+    Returns
+    -------
+    new_states : numpy array [int]
+        K x 6 array of advanced states.
+    """
+    states = np.asarray(states, dtype=np.int64).reshape(-1, 6)
+    A1k, A2k = jump_matrices(level, k)
+    nst1 = mat33_mat31_mod_array(A1k, states[:, 0:3], mrgm1)
+    nst2 = mat33_mat31_mod_array(A2k, states[:, 3:6], mrgm2)
+    new_states = np.hstack((nst1, nst2))
+    return new_states
+
+
+def consecutive_jump_states(states, level, n):
+    """Compute the states at the start of ``n`` consecutive streams, substreams,
+    or subsubstreams beginning at each of several states.
+
+    Notes
+    -----
+    The number of jumped states doubles with each call of ``jump_states``,
+    so only about log2(``n``) calls are needed.
+
+    Parameters
+    ----------
+    states : array [int]
+        K x 6 array whose rows are states of the generator.
+    level : int
+        0 for streams, 1 for substreams, 2 for subsubstreams.
+    n : int
+        Number of consecutive streams, substreams, or subsubstreams.
+
+    Returns
+    -------
+    new_states : numpy array [int]
+        K x n x 6 array; ``new_states[k, j]`` is ``states[k]`` advanced by
+        ``j`` streams, substreams, or subsubstreams.
+    """
+    new_states = np.asarray(states, dtype=np.int64).reshape(-1, 1, 6)
+    while new_states.shape[1] < n:
+        n_known = new_states.shape[1]
+        block = new_states[:, :n - n_known].reshape(-1, 6)
+        jumped = jump_states(block, level, n_known).reshape(new_states.shape[0], -1, 6)
+        new_states = np.concatenate((new_states, jumped), axis=1)
+    return new_states
+
+
 def bsm(u):
     """Approximate a quantile of the standard normal distribution via
     the Beasley-Springer-Moro algorithm.
@@ -166,6 +354,51 @@ def bsm(u):
     return z
 
 
+def bsm_array(u):
+    """Approximate quantiles of the standard normal distribution via
+    the Beasley-Springer-Moro algorithm, elementwise over an array.
+
+    Notes
+    -----
+    Agrees with ``bsm`` to the last bit. The powers and the logarithms
+    in the tails are taken elementwise with ``pow`` and ``math.log``,
+    because ``np.power`` and ``np.log`` can differ from them in the last
+    bit, and the terms are added in the same order as in ``bsm``.
+
+    Parameters
+    ----------
+    u : array [float]
+        Probability values for the desired quantiles (between 0 and 1).
+
+    Returns
+    -------
+    z : numpy array [float]
+        Corresponding quantiles of the standard normal distribution.
+    """
+    u = np.asarray(u, dtype=float)
+    y = u - 0.5
+    z = np.empty_like(y)
+    center = np.abs(y) < 0.42
+    # Approximate from the center (Beasly-Springer 1977).
+    yc = y[center]
+    r = np.array([pow(v, 2) for v in yc.tolist()])
+    r2, r3, r4 = [np.array([pow(v, k) for v in r.tolist()]) for k in range(2, 5)]
+    asum = bsma[0] + bsma[1] * r + bsma[2] * r2 + bsma[3] * r3
+    bsum = 1 + bsmb[0] * r + bsmb[1] * r2 + bsmb[2] * r3 + bsmb[3] * r4
+    z[center] = yc * (asum / bsum)
+    # Approximate from the tails (Moro 1995).
+    tail = ~center
+    ut = u[tail]
+    lower = y[tail] < 0.0
+    r = np.where(lower, ut, 1 - ut)
+    s = [log(-log(v)) for v in r.tolist()]
+    t = bsmc[0] + bsmc[1] * np.array(s)
+    for k in range(2, 9):
+        t = t + bsmc[k] * np.array([pow(v, k) for v in s])
+    z[tail] = np.where(lower, -t, t)
+    return z
+
+
 class MRG32k3a(random.Random):
     """Implements mrg32k3a as the generator for a ``random.Random`` object.
 
@@ -207,14 +440,137 @@ class MRG32k3a(random.Random):
             s_ss_sss_index = [0, 0, 0]
         self.start_fixed_s_ss_sss(s_ss_sss_index)
 
+    @classmethod
+    def spawn_grid(cls, n_streams, n_substreams, s_ss_sss_index=None, ref_seed=(12345, 12345, 12345, 12345, 12345, 12345)):
+        """Create a grid of generators at the starts of consecutive streams and substreams.
+
+        Notes
+        -----
+        The starting states of all generators are computed together with
+        ``consecutive_jump_states`` rather than one generator at a time.
+
+        Parameters
+        ----------
+        n_streams : int
+            Number of consecutive streams.
+        n_substreams : int
+            Number of consecutive substreams within each stream.
+        s_ss_sss_index : list [int], optional
+            Triplet of the indices of the stream-substream-subsubstream of the
+            first generator in the grid.
+        ref_seed : tuple [int], optional
+            Seed from which to start the generators.
+
+        Returns
+        -------
+        grid : list [list [``rng.MRG32k3a``]]
+            Generators; ``grid[i][j]`` starts at
+            ``[s_ss_sss_index[0] + i, s_ss_sss_index[1] + j, s_ss_sss_index[2]]``.
+        """
+        if s_ss_sss_index is None:
+            s_ss_sss_index = [0, 0, 0]
+        first = cls(ref_seed=ref_seed, s_ss_sss_index=[s_ss_sss_index[0], 0, 0])
+        stream_starts = consecutive_jump_states(first.stream_start, 0, n_streams)[0]
+        substream_starts = stream_starts
+        if s_ss_sss_index[1] > 0:
+            substream_starts = jump_states(substream_starts, 1, s_ss_sss_index[1])
+        substream_starts = consecutive_jump_states(substream_starts, 1, n_substreams)
+        subsubstream_starts = substream_starts
+        if s_ss_sss_index[2] > 0:
+            subsubstream_starts = jump_states(subsubstream_starts.reshape(-1, 6), 2, s_ss_sss_index[2]).reshape(substream_starts.shape)
+        grid = []
+        for i in range(n_streams):
+            stream_start = tuple(int(x) for x in stream_starts[i])
+            row = []
+            for j in range(n_substreams):
+                rng = cls(ref_seed=ref_seed)
+                rng.stream_start = stream_start
+                rng.substream_start = tuple(int(x) for x in substream_starts[i, j])
+                rng.subsubstream_start = tuple(int(x) for x in subsubstream_starts[i, j])
+                rng.seed(rng.subsubstream_start)
+                rng.s_ss_sss_index = [s_ss_sss_index[0] + i, s_ss_sss_index[1] + j, s_ss_sss_index[2]]
+                row.append(rng)
+            grid.append(row)
+        return grid
+
     def __deepcopy__(self, memo):
         cls = self.__class__
         result = cls.__new__(cls)
         memo[id(self)] = result
-        for k, v in self.__dict__.items():
-            setattr(result, k, deepcopy(v, memo))
+        # States and seeds are tuples of ints, so only the index list is copied.
+        result.__dict__.update(self.__dict__)
+        result.s_ss_sss_index = list(self.s_ss_sss_index)
         return result
 
+    def __getstate__(self):
+        """Return the compact state of the generator used for pickling.
+        The unused state of ``random.Random`` is not included.
+
+        Returns
+        -------
+        tuple
+            Reference seed, stream-substream-subsubstream indices, and
+            states at the starts of the current stream, substream, and
+            subsubstream and the current state.
+        """
+        return (self.ref_seed, tuple(self.s_ss_sss_index), self.stream_start, self.substream_start, self.subsubstream_start, self._current_state)
+
+    def __setstate__(self, state):
+        """Restore the generator from the compact state returned by ``__getstate__``.
+
+        Parameters
+        ----------
+        state : tuple
+            Compact state of the generator.
+        """
+        if len(state) == 2:
+            # State pickled by ``random.Random.__reduce__``.
+            self.setstate(state)
+            return
+        self.ref_seed, s_ss_sss_index, self.stream_start, self.substream_start, self.subsubstream_start, current_state = state
+        self.s_ss_sss_index = list(s_ss_sss_index)
+        self.seed(current_state)
+
+    def __reduce__(self):
+        return (self.__class__, (self.ref_seed,), self.__getstate__())
+
+    def snapshot(self):
+        """Return a snapshot of the generator from which an independent
+        copy can be restored later.
+
+        Returns
+        -------
+        tuple
+            Compact state of the generator.
+
+        See also
+        --------
+        restore
+        """
+        return self.__getstate__()
+
+    @classmethod
+    def restore(cls, snapshot):
+        """Create a generator from a snapshot returned by ``snapshot``.
+        Bypasses ``__init__``, so no jumps are recomputed.
+
+        Parameters
+        ----------
+        snapshot : tuple
+            Compact state of the generator.
+
+        Returns
+        -------
+        ``rng.MRG32k3a``
+            Generator at the position of the snapshot.
+        """
+        rng = cls.__new__(cls)
+        rng.version = 2
+        rng.generate = mrg32k3a
+        rng.gauss_next = None
+        rng.__setstate__(snapshot)
+        return rng
+
     def seed(self, new_state):
         """Set the state (or seed) of the generator and update the generator state.
 
@@ -273,6 +629,59 @@ class MRG32k3a(random.Random):
         self.seed(new_state)
         return u
 
+    def random_block(self, n):
+        """Generate a block of standard uniform variates and advance the
+        generator state. Equivalent to ``n`` calls of ``random()``.
+
+        Parameters
+        ----------
+        n : int
+            Number of uniform variates to generate.
+
+        Returns
+        -------
+        u : numpy array [float]
+            Pseudo uniform random variates.
+        """
+        state = self._current_state
+        new_state, u = mrg32k3a_block(state, n)
+        self.seed(new_state)
+        return u
+
+    def skip(self, n):
+        """Advance the generator state by ``n`` steps without generating variates.
+        Equivalent to ``n`` calls of ``random()``.
+
+        Parameters
+        ----------
+        n : int
+            Number of steps to advance.
+        """
+        assert(n >= 0)
+        state = self._current_state
+        # Split the state into 2 components of length 3.
+        st1 = state[0:3]
+        st2 = state[3:6]
+        # Efficiently advance state -> A*s % m for both state parts.
+        A1k, A2k = jump_matrices(3, n)
+        nst1 = mat31_mod(mat33_mat31_mult(A1k, st1), mrgm1)
+        nst2 = mat31_mod(mat33_mat31_mult(A2k, st2), mrgm2)
+        nstate = tuple(nst1 + nst2)
+        self.seed(nstate)
+
+    def at_offset(self, n):
+        """Set the generator state to ``n`` steps after the start of the current
+        subsubstream, i.e., so that the next ``random()`` returns the
+        (``n`` + 1)-th uniform of the subsubstream.
+
+        Parameters
+        ----------
+        n : int
+            Offset from the start of the current subsubstream.
+        """
+        self.reset_subsubstream()
+        self.skip(n)
+
     def get_current_state(self):
         """Return the current state of the generator.
 
@@ -403,6 +812,208 @@ class MRG32k3a(random.Random):
         q = mu - beta * np.log(-np.log(u))
         return q
 
+    def normalvariates(self, mu, sigma, n):
+        """Generate a block of normal random variates.
+        Consumes the same uniforms as ``n`` calls of ``normalvariate()``.
+
+        Parameters
+        ----------
+        mu : float
+            Expected value of the normal distribution from which to
+            generate.
+        sigma : float
+            Standard deviation of the normal distribution from which to
+            generate.
+        n : int
+            Number of random variates to generate.
+
+        Returns
+        -------
+        numpy array [float]
+            Normal random variates from the specified distribution.
+        """
+        u = self.random_block(n)
+        z = bsm_array(u)
+        return mu + sigma * z
+
+    def lognormalvariates(self, lq, uq, n):
+        """Generate a block of lognormal random variates using 2.5% and 97.5% quantiles.
+        Consumes the same uniforms as ``n`` calls of ``lognormalvariate()``.
+
+        Parameters
+        ----------
+        lq : float
+            2.5% quantile of the lognormal distribution from which to
+            generate.
+        uq : float
+            97.5% quantile of the lognormal distribution from which to
+            generate.
+        n : int
+            Number of random variates to generate.
+
+        Returns
+        -------
+        numpy array [float]
+            Lognormal random variates from the specified distribution.
+        """
+        mu = (log(lq) + log(uq)) / 2
+        sigma = (log(uq) - mu) / 1.96
+        x = self.normalvariates(mu, sigma, n)
+        return np.array([exp(v) for v in x.tolist()])
+
+    def expovariates(self, lambd, n):
+        """Generate a block of exponential random variates.
+        Consumes the same uniforms as ``n`` calls of ``expovariate()``.
+
+        Notes
+        -----
+        The logarithms are taken elementwise with ``math.log``, as in
+        ``expovariate()``, so results agree with it to the last bit.
+
+        Parameters
+        ----------
+        lambd : float
+            Rate parameter of the exponential distribution from which to
+            generate.
+        n : int
+            Number of random variates to generate.
+
+        Returns
+        -------
+        numpy array [float]
+            Exponential random variates from the specified distribution.
+        """
+        u = self.random_block(n)
+        return np.array([-log(1.0 - v) / lambd for v in u.tolist()])
+
+    def gammavariates(self, alpha, beta, n):
+        """Generate a block of gamma random variates.
+        Consumes the same uniforms as ``n`` calls of ``gammavariate()``.
+
+        Notes
+        -----
+        Except for ``alpha == 1``, the gamma variates are generated by
+        acceptance-rejection and the number of uniforms consumed per variate
+        is random, so the variates are generated one at a time.
+
+        Parameters
+        ----------
+        alpha : float
+            Shape parameter of the gamma distribution from which to
+            generate.
+        beta : float
+            Scale parameter of the gamma distribution from which to
+            generate.
+        n : int
+            Number of random variates to generate.
+
+        Returns
+        -------
+        numpy array [float]
+            Gamma random variates from the specified distribution.
+        """
+        if alpha == 1.0 and beta > 0.0:
+            u = self.random_block(n)
+            return np.array([-log(1.0 - v) * beta for v in u.tolist()])
+        return np.array([self.gammavariate(alpha, beta) for _ in range(n)])
+
+    def betavariates(self, alpha, beta, n):
+        """Generate a block of beta random variates.
+        Consumes the same uniforms as ``n`` calls of ``betavariate()``.
+
+        Parameters
+        ----------
+        alpha : float
+            First shape parameter of the beta distribution from which to
+            generate.
+        beta : float
+            Second shape parameter of the beta distribution from which to
+            generate.
+        n : int
+            Number of random variates to generate.
+
+        Returns
+        -------
+        numpy array [float]
+            Beta random variates from the specified distribution.
+        """
+        return np.array([self.betavariate(alpha, beta) for _ in range(n)])
+
+    def poissonvariates(self, lmbda, n):
+        """Generate a block of Poisson random variates.
+        Consumes the same uniforms as ``n`` calls of ``poissonvariate()``.
+
+        Notes
+        -----
+        For ``lmbda < 35``, the number of uniforms consumed per variate
+        is random. The variates are computed from a block of uniforms, and
+        the generator is then moved back to just after the uniforms used.
+
+        Parameters
+        ----------
+        lmbda : float
+            Expected value of the Poisson distribution from which to
+            generate.
+        n : int
+            Number of random variates to generate.
+
+        Returns
+        -------
+        numpy array [int]
+            Poisson random variates from the specified distribution.
+        """
+        if lmbda < 35:
+            threshold = exp(-lmbda)
+            state = self._current_state
+            # Each variate consumes lmbda + 1 uniforms on average.
+            block_size = int(n * (lmbda + 1) + 4 * sqrt(n * (lmbda + 1))) + 1
+            u = self.random_block(block_size).tolist()
+            variates = [0] * n
+            i = 0
+            for j in range(n):
+                # Multiply uniforms until the product falls below exp(-lmbda),
+                # exactly as in ``poissonvariate()``.
+                if i == len(u):
+                    u.extend(self.random_block(block_size).tolist())
+                p = u[i]
+                i += 1
+                k = 0
+                while p >= threshold:
+                    if i == len(u):
+                        u.extend(self.random_block(block_size).tolist())
+                    p = p * u[i]
+                    i += 1
+                    k += 1
+                variates[j] = k
+            self.seed(state)
+            self.skip(i)
+            return np.array(variates, dtype=int)
+        z = self.normalvariates(0, 1, n)
+        return np.maximum(np.ceil(lmbda + sqrt(lmbda) * z - 0.5), 0).astype(int)
+
+    def gumbelvariates(self, mu, beta, n):
+        """Generate a block of Gumbel random variates.
+        Consumes the same uniforms as ``n`` calls of ``gumbelvariate()``.
+
+        Parameters
+        ----------
+        mu : float
+            Location of the mode of the Gumbel distribution from which to
+            generate.
+        beta : float
+            Scale parameter of the Gumbel distribution from which to
+            generate.
+        n : int
+            Number of random variates to generate.
+
+        Returns
+        -------
+        numpy array [float]
+            Gumbel random variates from the specified distribution.
+        """
+        u = self.random_block(n)
+        return mu - beta * np.log(-np.log(u))
+
     def integer_random_vector_from_simplex(self, n_elements, summation, with_zero=False):
         """Generate a random vector with a specified number of non-negative integer
         elements that sum up to a specified number.
@@ -559,6 +1170,42 @@ class MRG32k3a(random.Random):
         # Update state referencing.
         self.subsubstream_start = nstate
 
+    def subsubstream_lanes(self, n):
+        """Split the generator into lanes for ``n`` consecutive replications.
+        Lane 0 continues from the current state and lane ``j`` starts at the
+        ``j``-th following subsubstream. The generator is advanced to the start
+        of the ``n``-th following subsubstream, as if ``advance_subsubstream()``
+        were called after each of ``n`` replications.
+
+        Parameters
+        ----------
+        n : int
+            Number of lanes.
+
+        Returns
+        -------
+        ``rng.MRG32k3aLanes``
+            Generators advanced in lockstep, one per replication.
+        """
+        starts = consecutive_jump_states(self.subsubstream_start, 2, n + 1)[0]
+        lanes = MRG32k3aLanes([self])
+        lanes.n_lanes = n
+        lanes.ref_seeds = [self.ref_seed] * n
+        lanes.s_ss_sss_indices = np.repeat(lanes.s_ss_sss_indices, n, axis=0)
+        lanes.s_ss_sss_indices[:, 2] += np.arange(n)
+        lanes.stream_starts = np.repeat(lanes.stream_starts, n, axis=0)
+        lanes.substream_starts = np.repeat(lanes.substream_starts, n, axis=0)
+        lanes.subsubstream_starts = starts[:n].copy()
+        current_state = lanes._current_states[0]
+        lanes._current_states = starts[:n].copy()
+        lanes._current_states[0] = current_state
+        # Advance to the start of the subsubstream following the last lane.
+        nstate = tuple(int(x) for x in starts[n])
+        self.seed(nstate)
+        self.s_ss_sss_index[2] += n
+        self.subsubstream_start = nstate
+        return lanes
+
     def reset_stream(self):
         """Reset the state of the generator to the start of the current stream.
         """
@@ -599,28 +1246,177 @@ class MRG32k3a(random.Random):
         # Split the reference seed into 2 components of length 3.
         st1 = state[0:3]
         st2 = state[3:6]
-        # Advance to start of specified stream.
-        # Efficiently advance state -> A*s % m for both state parts.
-        nst1m = mat33_mat31_mult(mat33_power_mod(A1p141, s_ss_sss_triplet[0], mrgm1), st1)
-        nst2m = mat33_mat31_mult(mat33_power_mod(A2p141, s_ss_sss_triplet[0], mrgm2), st2)
-        st1 = mat31_mod(nst1m, mrgm1)
-        st2 = mat31_mod(nst2m, mrgm2)
-        self.stream_start = tuple(st1 + st2)
-        # Advance to start of specified substream.
-        # Efficiently advance state -> A*s % m for both state parts.
-        nst1m = mat33_mat31_mult(mat33_power_mod(A1p94, s_ss_sss_triplet[1], mrgm1), st1)
-        nst2m = mat33_mat31_mult(mat33_power_mod(A2p94, s_ss_sss_triplet[1], mrgm2), st2)
-        st1 = mat31_mod(nst1m, mrgm1)
-        st2 = mat31_mod(nst2m, mrgm2)
-        self.substream_start = tuple(st1 + st2)
-        # Advance to start of specified subsubstream.
-        # Efficiently advance state -> A*s % m for both state parts.
-        nst1m = mat33_mat31_mult(mat33_power_mod(A1p47, s_ss_sss_triplet[2], mrgm1), st1)
-        nst2m = mat33_mat31_mult(mat33_power_mod(A2p47, s_ss_sss_triplet[2], mrgm2), st2)
-        st1 = mat31_mod(nst1m, mrgm1)
-        st2 = mat31_mod(nst2m, mrgm2)
-        self.subsubstream_start = tuple(st1 + st2)
-        nstate = tuple(st1 + st2)
-        self.seed(nstate)
+        starts = []
+        # Advance to start of specified stream, then substream, then subsubstream.
+        for level in range(3):
+            if s_ss_sss_triplet[level] > 0:
+                # Efficiently advance state -> A*s % m for both state parts.
+                A1k, A2k = jump_matrices(level, s_ss_sss_triplet[level])
+                st1 = mat31_mod(mat33_mat31_mult(A1k, st1), mrgm1)
+                st2 = mat31_mod(mat33_mat31_mult(A2k, st2), mrgm2)
+            starts.append(tuple(st1) + tuple(st2))
+        self.stream_start, self.substream_start, self.subsubstream_start = starts
+        self.seed(self.subsubstream_start)
         # Update index referencing.
         self.s_ss_sss_index = s_ss_sss_triplet
+
+
+class MRG32k3aLanes(object):
+    """Advances several mrg32k3a generators ("lanes") in lockstep.
+    Lane ``k`` produces the same sequence as the ``rng.MRG32k3a``
+    object it was created from.
+
+    Attributes
+    ----------
+    n_lanes : int
+        Number of generators advanced in lockstep.
+    ref_seeds : list [tuple [int]]
+        Seed from which each generator was started.
+    s_ss_sss_indices : numpy array [int]
+        n_lanes x 3 array of the indices of the current
+        stream-substream-subsubstream of each generator.
+    stream_starts : numpy array [int]
+        n_lanes x 6 array of states at the start of the current streams.
+    substream_starts : numpy array [int]
+        n_lanes x 6 array of states at the start of the current substreams.
+    subsubstream_starts : numpy array [int]
+        n_lanes x 6 array of states at the start of the current subsubstreams.
+    _current_states : numpy array [int]
+        n_lanes x 6 array of current states of the generators.
+
+    Parameters
+    ----------
+    rng_list : list [``rng.MRG32k3a``]
+        Generators whose states are copied into the lanes.
+    """
+    def __init__(self, rng_list):
+        self.n_lanes = len(rng_list)
+        self.ref_seeds = [rng.ref_seed for rng in rng_list]
+        self.s_ss_sss_indices = np.array([rng.s_ss_sss_index for rng in rng_list], dtype=np.int64).reshape(-1, 3)
+        self.stream_starts = np.array([rng.stream_start for rng in rng_list], dtype=np.int64).reshape(-1, 6)
+        self.substream_starts = np.array([rng.substream_start for rng in rng_list], dtype=np.int64).reshape(-1, 6)
+        self.subsubstream_starts = np.array([rng.subsubstream_start for rng in rng_list], dtype=np.int64).reshape(-1, 6)
+        self._current_states = np.array([rng.get_current_state() for rng in rng_list], dtype=np.int64).reshape(-1, 6)
+
+    def random(self):
+        """Generate one standard uniform variate per lane and advance
+        the generator states.
+
+        Returns
+        -------
+        u : numpy array [float]
+            Pseudo uniform random variates, one per lane.
+        """
+        st = self._current_states
+        p1 = (mrga12 * st[:, 1] - mrga13n * st[:, 0]) % mrgm1
+        p2 = (mrga21 * st[:, 5] - mrga23n * st[:, 3]) % mrgm2
+        self._current_states = np.column_stack((st[:, 1], st[:, 2], p1, st[:, 4], st[:, 5], p2))
+        diff = p1 - p2
+        u = np.where(diff <= 0, diff + mrgm1, diff) * mrgnorm
+        return u
+
+    def random_block(self, n):
+        """Generate ``n`` standard uniform variates per lane and advance
+        the generator states.
+
+        Parameters
+        ----------
+        n : int
+            Number of uniform variates to generate per lane.
+
+        Returns
+        -------
+        u : numpy array [float]
+            n_lanes x ``n`` array of pseudo uniform random variates.
+        """
+        u = np.empty((self.n_lanes, n))
+        for i in range(n):
+            u[:, i] = self.random()
+        return u
+
+    def normalvariate(self, mu=0, sigma=1):
+        """Generate one normal random variate per lane.
+
+        Parameters
+        ----------
+        mu : float or array [float]
+            Expected value of the normal distribution from which to
+            generate.
+        sigma : float or array [float]
+            Standard deviation of the normal distribution from which to
+            generate.
+
+        Returns
+        -------
+        numpy array [float]
+            Normal random variates, one per lane.
+        """
+        z = bsm_array(self.random())
+        return mu + sigma * z
+
+    def expovariate(self, lambd):
+        """Generate one exponential random variate per lane.
+
+        Parameters
+        ----------
+        lambd : float or array [float]
+            Rate parameter of the exponential distribution from which to
+            generate.
+
+        Returns
+        -------
+        numpy array [float]
+            Exponential random variates, one per lane.
+        """
+        u = self.random()
+        return np.array([-log(1.0 - v) for v in u.tolist()]) / lambd
+
+    def get_current_states(self):
+        """Return the current states of the generators.
+
+        Returns
+        -------
+        _current_states : numpy array [int]
+            n_lanes x 6 array of current states of the generators.
+        """
+        return self._current_states
+
+    def advance_subsubstream(self):
+        """Advance the state of every generator to the start of its next subsubstream.
+        """
+        self.subsubstream_starts = jump_states(self.subsubstream_starts, 2)
+        self._current_states = self.subsubstream_starts
+        self.s_ss_sss_indices[:, 2] += 1
+
+    def advance_substream(self):
+        """Advance the state of every generator to the start of its next substream.
+        """
+        self.substream_starts = jump_states(self.substream_starts, 1)
+        self.subsubstream_starts = self.substream_starts
+        self._current_states = self.substream_starts
+        self.s_ss_sss_indices[:, 1] += 1
+        self.s_ss_sss_indices[:, 2] = 0
+
+    def reset_subsubstream(self):
+        """Reset the state of every generator to the start of its current subsubstream.
+        """
+        self._current_states = self.subsubstream_starts
+
+    def to_rngs(self):
+        """Create one ``rng.MRG32k3a`` object per lane at the lane's current state.
+
+        Returns
+        -------
+        rng_list : list [``rng.MRG32k3a``]
+            Generators with the same states and indices as the lanes.
+        """
+        rng_list = []
+        for k in range(self.n_lanes):
+            rng = MRG32k3a(ref_seed=self.ref_seeds[k])
+            rng.stream_start = tuple(int(x) for x in self.stream_starts[k])
+            rng.substream_start = tuple(int(x) for x in self.substream_starts[k])
+            rng.subsubstream_start = tuple(int(x) for x in self.subsubstream_starts[k])
+            rng.s_ss_sss_index = [int(x) for x in self.s_ss_sss_indices[k]]
+            rng.seed(tuple(int(x) for x in self._current_states[k]))
+            rng_list.append(rng)
+        return rng_list
@@ -87,8 +87,8 @@ class RandomSearch(Solver):
 
         Returns
         -------
-        recommended_solns : list of Solution objects
-            list of solutions recommended throughout the budget
+        recommended_solns : list of SolutionSummary objects
+            summaries of the solutions recommended throughout the budget
         intermediate_budgets : list of ints
             list of intermediate budgets when recommended solutions changes
         """
@@ -119,7 +119,11 @@ class RandomSearch(Solver):
                     > problem.minmax * best_solution.objectives_mean and
                     all(new_solution.stoch_constraints_mean[idx] <= 0 for idx in range(problem.n_stochastic_constraints))):
                 # If better, record incumbent solution as best.
+                # The previous best is no longer simulated, so keep only its summary.
+                recommended_solns[-1] = best_solution.summarize()
                 best_solution = new_solution
                 recommended_solns.append(new_solution)
                 intermediate_budgets.append(expended_budget)
+        # Summarize the final incumbent too, so every recommendation has the same type.
+        recommended_solns[-1] = best_solution.summarize()
         return recommended_solns, intermediate_budgets
@@ -460,14 +460,19 @@ class STRONG(Solver):
                 FnPlusMinus[i, 2] = steph2
                 x2[i] = x2[i] - FnPlusMinus[i, 2]
             x1_solution = self.create_new_solution(tuple(x1), problem)
+            x2_solution = self.create_new_solution(tuple(x2), problem)
+            # Simulate both sides of the stencil together.
+            stencil_solutions = []
+            if BdsCheck[i] != -1:
+                stencil_solutions.append(x1_solution)
+            if BdsCheck[i] != 1:
+                stencil_solutions.append(x2_solution)
+            problem.simulate_up_to(stencil_solutions, n_r)
             if BdsCheck[i] != -1:
-                problem.simulate_up_to([x1_solution], n_r)
                 fn1 = -1 * problem.minmax[0] * x1_solution.objectives_mean
                 # First column is f(x+h,y).
                 FnPlusMinus[i, 0] = fn1
-            x2_solution = self.create_new_solution(tuple(x2), problem)
             if BdsCheck[i] != 1:
-                problem.simulate_up_to([x2_solution], n_r)
                 fn2 = -1 * problem.minmax[0] * x2_solution.objectives_mean
                 # Second column is f(x-h,y).
                 FnPlusMinus[i, 1] = fn2
@@ -0,0 +1,149 @@
+#!/usr/bin/env python
+"""
+Summary
+-------
+Benchmark the throughput of ``rng.MRG32k3a`` and check that every
+accelerated path reproduces the reference sequence.
+Run from the top-level directory with ``python -m test.benchmark_mrg32k3a``.
+"""
+
+import time
+import pickle
+from copy import deepcopy
+
+import numpy as np
+
+from rng.mrg32k3a import MRG32k3a, MRG32k3aLanes, jump_matrices
+
+
+# Indices of a generator deep inside the stream/substream/subsubstream tree.
+deep_index = [2**40 + 17, 2**40 + 5, 2**40 + 3]
+
+
+def check_equivalence(n=10000):
+    """Assert that accelerated paths produce the same sequences as the
+    reference scalar methods.
+
+    Parameters
+    ----------
+    n : int, optional
+        Number of variates to compare per check.
+    """
+    # Uniforms.
+    rng = MRG32k3a(s_ss_sss_index=deep_index)
+    rng2 = MRG32k3a(s_ss_sss_index=deep_index)
+    assert list(rng.random_block(n)) == [rng2.random() for _ in range(n)], "random_block differs from random"
+    assert rng.get_current_state() == rng2.get_current_state(), "random_block leaves a different state"
+    # Skipping ahead.
+    rng.skip(n)
+    rng2.random_block(n)
+    assert rng.get_current_state() == rng2.get_current_state(), "skip differs from random_block"
+    # Non-uniform variates.
+    batched = {
+        "normal": (lambda r: r.normalvariates(1, 2, n), lambda r: r.normalvariate(1, 2)),
+        "lognormal": (lambda r: r.lognormalvariates(10, 200, n), lambda r: r.lognormalvariate(10, 200)),
+        "exponential": (lambda r: r.expovariates(1.5, n), lambda r: r.expovariate(1.5)),
+        "gamma": (lambda r: r.gammavariates(2.5, 1, n), lambda r: r.gammavariate(2.5, 1)),
+        "beta": (lambda r: r.betavariates(2, 3, n), lambda r: r.betavariate(2, 3)),
+        "poisson": (lambda r: r.poissonvariates(50, n), lambda r: r.poissonvariate(50)),
+        "gumbel": (lambda r: r.gumbelvariates(1, 2, n), lambda r: r.gumbelvariate(1, 2))
+    }
+    for name, (block_fn, scalar_fn) in batched.items():
+        rng = MRG32k3a()
+        rng2 = MRG32k3a()
+        x = block_fn(rng)
+        x2 = [scalar_fn(rng2) for _ in range(n)]
+        assert list(x) == x2, f"{name} variates differ"
+        assert rng.get_current_state() == rng2.get_current_state(), f"{name} variates consume a different number of uniforms"
+    # Construction.
+    grid = MRG32k3a.spawn_grid(n_streams=3, n_substreams=3, s_ss_sss_index=deep_index)
+    for i in range(3):
+        for j in range(3):
+            rng = MRG32k3a(s_ss_sss_index=[deep_index[0] + i, deep_index[1] + j, deep_index[2]])
+            assert grid[i][j].get_current_state() == rng.get_current_state(), "spawn_grid differs from constructor"
+    # Lanes.
+    rngs = [MRG32k3a(s_ss_sss_index=[s, 0, 0]) for s in range(8)]
+    lanes = MRG32k3aLanes(rngs)
+    u = lanes.random_block(100)
+    for k in range(8):
+        assert list(u[k]) == list(rngs[k].random_block(100)), "lanes differ from scalar generators"
+    # Copying and pickling.
+    rng = MRG32k3a(s_ss_sss_index=deep_index)
+    rng.random()
+    for rng2 in [deepcopy(rng), pickle.loads(pickle.dumps(rng))]:
+        assert rng2.get_current_state() == rng.get_current_state(), "copy has a different state"
+        assert rng2.s_ss_sss_index == rng.s_ss_sss_index, "copy has different indices"
+        assert rng2.subsubstream_start == rng.subsubstream_start, "copy has a different subsubstream start"
+
+
+def time_per_call(fn, n_calls):
+    """Return the average time (in seconds) of ``n_calls`` calls of ``fn``.
+
+    Parameters
+    ----------
+    fn : function
+        Function with no arguments to time.
+    n_calls : int
+        Number of calls to make.
+
+    Returns
+    -------
+    float
+        Average time per call.
+    """
+    tic = time.perf_counter()
+    for _ in range(n_calls):
+        fn()
+    toc = time.perf_counter()
+    return (toc - tic) / n_calls
+
+
+def run_benchmarks(n=100000):
+    """Measure throughput of variate generation, construction, and copying.
+
+    Parameters
+    ----------
+    n : int, optional
+        Number of variates generated per throughput measurement.
+
+    Returns
+    -------
+    results : dict
+        Measured rates (per second) and sizes (in bytes), keyed by description.
+    """
+    results = {}
+    rng = MRG32k3a()
+    # Uniforms per second.
+    results["uniforms/s, random()"] = n / time_per_call(lambda: [rng.random() for _ in range(n)], 1)
+    results["uniforms/s, random_block(n)"] = n / time_per_call(lambda: rng.random_block(n), 1)
+    lanes = MRG32k3aLanes([MRG32k3a(s_ss_sss_index=[s, 0, 0]) for s in range(1000)])
+    results["uniforms/s, MRG32k3aLanes (1000 lanes)"] = n / time_per_call(lambda: lanes.random_block(n // 1000), 1)
+    # Non-uniform variates per second.
+    distributions = {
+        "normal": (lambda: rng.normalvariate(1, 2), lambda: rng.normalvariates(1, 2, n)),
+        "exponential": (lambda: rng.expovariate(1.5), lambda: rng.expovariates(1.5, n)),
+        "gamma": (lambda: rng.gammavariate(2.5, 1), lambda: rng.gammavariates(2.5, 1, n)),
+        "beta": (lambda: rng.betavariate(2, 3), lambda: rng.betavariates(2, 3, n)),
+        "poisson": (lambda: rng.poissonvariate(50), lambda: rng.poissonvariates(50, n)),
+        "gumbel": (lambda: rng.gumbelvariate(1, 2), lambda: rng.gumbelvariates(1, 2, n))
+    }
+    for name, (scalar_fn, block_fn) in distributions.items():
+        results[f"{name} variates/s, scalar"] = 1 / time_per_call(scalar_fn, n)
+        results[f"{name} variates/s, batched"] = n / time_per_call(block_fn, 1)
+    # Generators constructed per second at deep indices.
+    n_rngs = 1000
+    results["constructions/s, deep index, cold cache"] = 1 / time_per_call(lambda: (jump_matrices.cache_clear(), MRG32k3a(s_ss_sss_index=deep_index)), 100)
+    results["constructions/s, deep index, warm cache"] = 1 / time_per_call(lambda: MRG32k3a(s_ss_sss_index=deep_index), n_rngs)
+    results["constructions/s, spawn_grid (100 x 10)"] = n_rngs / time_per_call(lambda: MRG32k3a.spawn_grid(n_streams=100, n_substreams=10, s_ss_sss_index=deep_index), 1)
+    # Copies and pickles per second.
+    results["deepcopies/s"] = 1 / time_per_call(lambda: deepcopy(rng), n_rngs)
+    results["pickle round trips/s"] = 1 / time_per_call(lambda: pickle.loads(pickle.dumps(rng)), n_rngs)
+    results["pickle size (bytes)"] = len(pickle.dumps(rng))
+    return results
+
+
+if __name__ == "__main__":
+    check_equivalence()
+    print("All accelerated paths reproduce the reference sequences.")
+    for description, value in run_benchmarks().items():
+        print(f"{description:<50} {value:>16,.0f}")
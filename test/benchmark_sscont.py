@@ -0,0 +1,177 @@
+#!/usr/bin/env python
+"""
+Summary
+-------
+Benchmark ``models.sscont.SSCont.replicate`` against the previous
+implementation, which marked outstanding orders day by day, and check
+that both produce the same responses.
+Run from the top-level directory with ``python -m test.benchmark_sscont``.
+"""
+
+import time
+
+import numpy as np
+
+from rng.mrg32k3a import MRG32k3a
+from models.sscont import SSCont
+
+
+def reference_replicate(model, rng_list):
+    """Simulate a replication of the (s,S) inventory model as the previous
+    implementation of ``SSCont.replicate`` did.
+
+    Parameters
+    ----------
+    model : ``models.sscont.SSCont``
+        Model with its factors set.
+    rng_list : list [``rng.MRG32k3a``]
+        RNGs for model to use when simulating a replication.
+
+    Returns
+    -------
+    responses : dict
+        Performance measures of interest.
+    """
+    # Designate random number generators.
+    demand_rng = rng_list[0]
+    lead_rng = rng_list[1]
+    # Generate exponential random demands.
+    demands = [demand_rng.expovariate(1/model.factors["demand_mean"]) for _ in range(model.factors["n_days"] + model.factors["warmup"])]
+    # Initialize starting and ending inventories for each period.
+    start_inv = np.zeros(model.factors["n_days"] + model.factors["warmup"])
+    start_inv[0] = model.factors["s"]  # Start with s units at period 0.
+    end_inv = np.zeros(model.factors["n_days"] + model.factors["warmup"])
+    # Initialize other quantities to track:
+    #   - Amount of product to be received in each period.
+    #   - Inventory position each period.
+    #   - Amount of product ordered in each period.
+    #   - Amount of product outstanding in each period.
+    orders_received = np.zeros(model.factors["n_days"] + model.factors["warmup"])
+    inv_pos = np.zeros(model.factors["n_days"] + model.factors["warmup"])
+    orders_placed = np.zeros(model.factors["n_days"] + model.factors["warmup"])
+    orders_outstanding = np.zeros(model.factors["n_days"] + model.factors["warmup"])
+    # Run simulation over time horizon.
+    for day in range(model.factors["n_days"] + model.factors["warmup"]):
+        # Calculate end-of-period inventory on hand and inventory position.
+        end_inv[day] = start_inv[day] - demands[day]
+        inv_pos[day] = end_inv[day] + orders_outstanding[day]
+        # Place orders, keeping track of outstanding orders and when they will be received.
+        orders_placed[day] = np.max(((inv_pos[day] < model.factors["s"]) * (model.factors["S"] - inv_pos[day])), 0)
+        if orders_placed[day] > 0:
+            lead = lead_rng.poissonvariate(model.factors["lead_mean"])
+            for future_day in range(day + 1, day + lead + 1):
+                if future_day < model.factors["n_days"] + model.factors["warmup"]:
+                    orders_outstanding[future_day] = orders_outstanding[future_day] + orders_placed[day]
+            if day + lead + 1 < model.factors["n_days"] + model.factors["warmup"]:
+                orders_received[day + lead + 1] = orders_received[day + lead + 1] + orders_placed[day]
+        # Calculate starting inventory for next period.
+        if day < model.factors["n_days"] + model.factors["warmup"] - 1:
+            start_inv[day + 1] = end_inv[day] + orders_received[day + 1]
+    # Calculate responses from simulation data.
+    order_rate = np.mean(orders_placed[model.factors["warmup"]:] > 0)
+    stockout_rate = np.mean(end_inv[model.factors["warmup"]:] < 0)
+    avg_order_costs = np.mean(model.factors["fixed_cost"] * (orders_placed[model.factors["warmup"]:] > 0) +
+                              model.factors["variable_cost"] * orders_placed[model.factors["warmup"]:])
+    avg_holding_costs = np.mean(model.factors["holding_cost"] * end_inv[model.factors["warmup"]:] * [end_inv[model.factors["warmup"]:] > 0])
+    on_time_rate = 1 - np.sum(np.min(np.vstack((demands[model.factors["warmup"]:], demands[model.factors["warmup"]:] - start_inv[model.factors["warmup"]:])), axis=0)
+                              * ((demands[model.factors["warmup"]:] - start_inv[model.factors["warmup"]:]) > 0))/np.sum(demands[model.factors["warmup"]:])
+    avg_backorder_costs = model.factors["backorder_cost"]*(1 - on_time_rate)*np.sum(demands[model.factors["warmup"]:])/float(model.factors["n_days"])
+    if np.array(np.where(end_inv[model.factors["warmup"]:] < 0)).size == 0:
+        avg_stockout = 0
+    else:
+        avg_stockout = -np.mean(end_inv[model.factors["warmup"]:][np.where(end_inv[model.factors["warmup"]:] < 0)])
+    if np.array(np.where(orders_placed[model.factors["warmup"]:] > 0)).size == 0:
+        avg_order = 0
+    else:
+        avg_order = np.mean(orders_placed[model.factors["warmup"]:][np.where(orders_placed[model.factors["warmup"]:] > 0)])
+    # Compose responses and gradients.
+    responses = {"avg_backorder_costs": avg_backorder_costs,
+                 "avg_order_costs": avg_order_costs,
+                 "avg_holding_costs": avg_holding_costs,
+                 "on_time_rate": on_time_rate,
+                 "order_rate": order_rate,
+                 "stockout_rate": stockout_rate,
+                 "avg_stockout": avg_stockout,
+                 "avg_order": avg_order
+                 }
+    return responses
+
+
+def check_equivalence(factor_settings, n_reps=10):
+    """Assert that ``SSCont.replicate`` reproduces the reference responses
+    and leaves the RNGs in the same states.
+
+    Parameters
+    ----------
+    factor_settings : list [dict]
+        Model factors for which to compare the implementations.
+    n_reps : int, optional
+        Number of replications to compare per setting.
+    """
+    for fixed_factors in factor_settings:
+        model = SSCont(dict(fixed_factors))
+        for rep in range(n_reps):
+            rng_list = [MRG32k3a(s_ss_sss_index=[0, ss, rep]) for ss in range(model.n_rngs)]
+            rng_list2 = [MRG32k3a(s_ss_sss_index=[0, ss, rep]) for ss in range(model.n_rngs)]
+            responses, _ = model.replicate(rng_list)
+            reference_responses = reference_replicate(model, rng_list2)
+            assert responses == reference_responses, f"responses differ for {fixed_factors}"
+            assert [rng.get_current_state() for rng in rng_list] == [rng.get_current_state() for rng in rng_list2], f"rngs differ for {fixed_factors}"
+
+
+def time_per_replication(replicate, model, n_reps):
+    """Return the average time (in seconds) of a replication.
+
+    Parameters
+    ----------
+    replicate : function
+        Function simulating a replication of ``model`` from a list of RNGs.
+    model : ``models.sscont.SSCont``
+        Model with its factors set.
+    n_reps : int
+        Number of replications to time.
+
+    Returns
+    -------
+    float
+        Average time per replication.
+    """
+    rng_list = [MRG32k3a(s_ss_sss_index=[0, ss, 0]) for ss in range(model.n_rngs)]
+    tic = time.perf_counter()
+    for _ in range(n_reps):
+        replicate(model, rng_list)
+        for rng in rng_list:
+            rng.advance_subsubstream()
+    toc = time.perf_counter()
+    return (toc - tic) / n_reps
+
+
+def run_benchmarks(n_reps=5):
+    """Time both implementations for long horizons and long lead times.
+
+    Parameters
+    ----------
+    n_reps : int, optional
+        Number of replications timed per setting.
+
+    Returns
+    -------
+    results : dict
+        Time per replication (in seconds) of the reference and current
+        implementations, keyed by factor setting.
+    """
+    results = {}
+    for n_days in [100, 1000, 10000]:
+        for lead_mean in [6.0, 60.0, 600.0]:
+            model = SSCont({"n_days": n_days, "lead_mean": lead_mean, "S": 1000.0 + 100 * lead_mean})
+            results[(n_days, lead_mean)] = (time_per_replication(reference_replicate, model, n_reps),
+                                            time_per_replication(lambda model, rng_list: model.replicate(rng_list), model, n_reps))
+    return results
+
+
+if __name__ == "__main__":
+    check_equivalence([{}, {"lead_mean": 0.5}, {"lead_mean": 30.0, "n_days": 300}, {"s": 100.0, "S": 150.0}])
+    print("SSCont.replicate reproduces the reference responses.")
+    print(f"{'n_days':>8} {'lead_mean':>10} {'reference (s)':>14} {'current (s)':>12} {'speedup':>8}")
+    for (n_days, lead_mean), (reference_time, current_time) in run_benchmarks().items():
+        print(f"{n_days:>8} {lead_mean:>10.0f} {reference_time:>14.4f} {current_time:>12.4f} {reference_time / current_time:>8.1f}")
@@ -0,0 +1,311 @@
+import unittest
+import pickle
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import numpy as np
+from rng.mrg32k3a import MRG32k3a
+from base import Model, Problem, Solution, SolutionSummary
+from models.sscont import SSCont
+from solvers.randomsearch import RandomSearch
+
+
+class ExampleModel(Model):
+    """
+    A minimal model whose single response is a noisy quadratic
+    in one decision factor.
+    """
+    def __init__(self, fixed_factors=None):
+        if fixed_factors is None:
+            fixed_factors = {}
+        self.name = "EXAMPLE"
+        self.n_rngs = 1
+        self.n_responses = 1
+        self.specifications = {
+            "x": {
+                "description": "Decision variable.",
+                "datatype": float,
+                "default": 0.0
+            }
+        }
+        self.check_factor_list = {
+            "x": self.check_x
+        }
+        super().__init__(fixed_factors)
+
+    def check_x(self):
+        return True
+
+    def replicate(self, rng_list):
+        noise = rng_list[0].normalvariate()
+        responses = {"value": (self.factors["x"] - 1) ** 2 + noise}
+        gradients = {"value": {"x": 2 * (self.factors["x"] - 1)}}
+        return responses, gradients
+
+
+class ExampleProblem(Problem):
+    """
+    A minimal problem minimizing the expected response of ``ExampleModel``.
+    """
+    def __init__(self, name="EXAMPLE-1", fixed_factors=None, model_fixed_factors=None):
+        if fixed_factors is None:
+            fixed_factors = {}
+        if model_fixed_factors is None:
+            model_fixed_factors = {}
+        self.name = name
+        self.dim = 1
+        self.n_objectives = 1
+        self.n_stochastic_constraints = 0
+        self.objective_response_map = ({"value": 1},)
+        self.minmax = (-1,)
+        self.constraint_type = "unconstrained"
+        self.variable_type = "continuous"
+        self.lower_bounds = (-np.inf,)
+        self.upper_bounds = (np.inf,)
+        self.gradient_available = True
+        self.optimal_value = None
+        self.optimal_solution = None
+        self.model_default_factors = {}
+        self.model_decision_factors = {"x"}
+        self.factors = fixed_factors
+        self.specifications = {
+            "initial_solution": {
+                "description": "Initial solution from which solvers start.",
+                "datatype": tuple,
+                "default": (0.0,)
+            },
+            "budget": {
+                "description": "Max # of replications for a solver to take.",
+                "datatype": int,
+                "default": 1000
+            }
+        }
+        self.check_factor_list = {
+            "initial_solution": self.check_initial_solution,
+            "budget": self.check_budget
+        }
+        super().__init__(fixed_factors, model_fixed_factors)
+        self.model = ExampleModel(self.model_fixed_factors)
+
+    def vector_to_factor_dict(self, vector):
+        return {"x": vector[0]}
+
+    def factor_dict_to_vector(self, factor_dict):
+        return (factor_dict["x"],)
+
+    def response_dict_to_objectives(self, response_dict):
+        return (response_dict["value"],)
+
+    def get_random_solution(self, rand_sol_rng):
+        return (rand_sol_rng.normalvariate(),)
+
+
+def simulate_solution(problem, m, x=(0.5,), **kwargs):
+    # Simulate m replications at x from the start of stream 2.
+    solution = Solution(x, problem)
+    solution.attach_rngs([MRG32k3a(s_ss_sss_index=[2, 0, 0])], copy=False)
+    problem.simulate(solution, m, **kwargs)
+    return solution
+
+
+class TestModel(unittest.TestCase):
+
+    def test_replicate_batch(self):
+        mymodel = ExampleModel({"x": 2.0})
+        rng_list = [MRG32k3a(s_ss_sss_index=[1, 0, 0])]
+        responses, gradients = mymodel.replicate_batch(rng_list, 4)
+        rng_list2 = [MRG32k3a(s_ss_sss_index=[1, 0, 0])]
+        for rep in range(4):
+            rep_responses, rep_gradients = mymodel.replicate(rng_list2)
+            self.assertEqual(responses["value"][rep], rep_responses["value"])
+            self.assertEqual(gradients["value"]["x"][rep], rep_gradients["value"]["x"])
+            rng_list2[0].advance_subsubstream()
+        self.assertEqual(rng_list[0].s_ss_sss_index, [1, 0, 4])
+        self.assertEqual(rng_list[0]._current_state, rng_list2[0]._current_state)
+
+    def test_replicate_batch_several_rngs(self):
+        # SSCont draws from two rngs and relies on the default replicate_batch.
+        mymodel = SSCont()
+        rng_list = [MRG32k3a(s_ss_sss_index=[0, ss, 0]) for ss in range(mymodel.n_rngs)]
+        responses, gradients = mymodel.replicate_batch(rng_list, 3)
+        rng_list2 = [MRG32k3a(s_ss_sss_index=[0, ss, 0]) for ss in range(mymodel.n_rngs)]
+        for rep in range(3):
+            rep_responses, rep_gradients = mymodel.replicate(rng_list2)
+            for key in rep_responses:
+                self.assertEqual(responses[key][rep], rep_responses[key])
+            for rng in rng_list2:
+                rng.advance_subsubstream()
+        self.assertEqual([rng.s_ss_sss_index for rng in rng_list], [[0, ss, 3] for ss in range(mymodel.n_rngs)])
+        self.assertEqual([rng._current_state for rng in rng_list], [rng._current_state for rng in rng_list2])
+
+
+class TestProblem(unittest.TestCase):
+
+    def test_simulate(self):
+        myproblem = ExampleProblem()
+        solution = simulate_solution(myproblem, 6)
+        responses, gradients = ExampleModel({"x": 0.5}).replicate_batch([MRG32k3a(s_ss_sss_index=[2, 0, 0])], 6)
+        self.assertEqual(solution.n_reps, 6)
+        self.assertTrue(np.array_equal(solution.objectives[:6, 0], responses["value"]))
+        self.assertEqual(solution.rng_list[0].s_ss_sss_index, [2, 0, 6])
+
+    def test_simulate_parallel(self):
+        myproblem = ExampleProblem()
+        serial = simulate_solution(myproblem, 7)
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            myproblem.attach_executor(executor, chunk_size=2)
+            threaded = simulate_solution(myproblem, 7)
+        myproblem.attach_executor(None)
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            parallel = simulate_solution(myproblem, 7, executor=executor)
+        for solution in [threaded, parallel]:
+            self.assertEqual(solution.n_reps, 7)
+            self.assertTrue(np.array_equal(solution.objectives[:7], serial.objectives[:7]))
+            self.assertEqual(solution.rng_list[0]._current_state, serial.rng_list[0]._current_state)
+            self.assertEqual(solution.rng_list[0].s_ss_sss_index, [2, 0, 7])
+
+    def test_pickle_with_executor(self):
+        myproblem = ExampleProblem()
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            myproblem.attach_executor(executor, chunk_size=2)
+            myproblem2 = pickle.loads(pickle.dumps(myproblem))
+        myproblem.attach_executor(None)
+        self.assertIsNone(myproblem2.executor)
+        self.assertEqual(myproblem2.chunk_size, 2)
+        # Problems pickled before these attributes existed fall back to the defaults.
+        del myproblem2.chunk_size
+        self.assertIsNone(myproblem2.chunk_size)
+        self.assertTrue(np.array_equal(simulate_solution(myproblem2, 3).objectives[:3], simulate_solution(myproblem, 3).objectives[:3]))
+
+    def test_solution_cache(self):
+        myproblem = ExampleProblem()
+        myproblem.attach_solution_cache(max_size=2)
+        mysolver = RandomSearch()
+        mysolver.solution_progenitor_rngs = [MRG32k3a(s_ss_sss_index=[2, 0, 0])]
+        solution = mysolver.create_new_solution((0.5,), myproblem)
+        myproblem.simulate(solution, 5)
+        self.assertIs(mysolver.create_new_solution((0.5,), myproblem), solution)
+        self.assertEqual(solution.n_reps, 5)
+        mysolver.create_new_solution((1.5,), myproblem)
+        mysolver.create_new_solution((2.5,), myproblem)
+        self.assertIsNot(mysolver.create_new_solution((0.5,), myproblem), solution)
+        self.assertEqual((myproblem.solution_cache.hits, myproblem.solution_cache.misses), (1, 4))
+        self.assertEqual(len(myproblem.solution_cache), 2)
+        # Cached solutions are not sent along with a pickled problem.
+        myproblem2 = pickle.loads(pickle.dumps(myproblem))
+        self.assertIsNone(myproblem2.solution_cache)
+        self.assertEqual(len(myproblem.solution_cache), 2)
+
+    def test_response_map(self):
+        myproblem = ExampleProblem()
+        solution = simulate_solution(myproblem, 10)
+        myproblem.objective_response_map = None
+        solution2 = simulate_solution(myproblem, 10)
+        self.assertTrue(np.array_equal(solution.objectives[:10], solution2.objectives[:10]))
+
+    def test_simulate_up_to_parallel(self):
+        myproblem = ExampleProblem()
+        solutions = [Solution((x,), myproblem) for x in [0.0, 0.5, 1.0]]
+        for solution in solutions:
+            solution.attach_rngs([MRG32k3a(s_ss_sss_index=[2, 0, 0])], copy=False)
+        myproblem.simulate(solutions[0], 2)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            myproblem.attach_executor(executor, chunk_size=2)
+            myproblem.simulate_up_to(solutions, 5)
+        myproblem.attach_executor(None)
+        for solution in solutions:
+            serial = simulate_solution(myproblem, 5, x=solution.x)
+            self.assertEqual(solution.n_reps, 5)
+            self.assertTrue(np.array_equal(solution.objectives[:5], serial.objectives[:5]))
+            self.assertEqual(solution.rng_list[0]._current_state, serial.rng_list[0]._current_state)
+
+    def test_simulate_up_to_repeated_solution(self):
+        myproblem = ExampleProblem()
+        solution = Solution((0.5,), myproblem)
+        solution.attach_rngs([MRG32k3a(s_ss_sss_index=[2, 0, 0])], copy=False)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            myproblem.attach_executor(executor, chunk_size=2)
+            myproblem.simulate_up_to([solution, solution], 4)
+        myproblem.attach_executor(None)
+        serial = simulate_solution(myproblem, 4)
+        self.assertEqual(solution.n_reps, 4)
+        self.assertTrue(np.array_equal(solution.objectives[:4], serial.objectives[:4]))
+        self.assertEqual(solution.rng_list[0].s_ss_sss_index, [2, 0, 4])
+
+
+class TestSolver(unittest.TestCase):
+
+    def test_recommended_summaries(self):
+        myproblem = ExampleProblem(fixed_factors={"budget": 200})
+        mysolver = RandomSearch()
+        mysolver.attach_rngs([MRG32k3a(s_ss_sss_index=[0, 0, 0]), MRG32k3a(s_ss_sss_index=[0, 1, 0])])
+        mysolver.solution_progenitor_rngs = [MRG32k3a(s_ss_sss_index=[2, 0, 0])]
+        recommended_solns, intermediate_budgets = mysolver.solve(myproblem)
+        self.assertTrue(len(recommended_solns) > 1)
+        self.assertTrue(all(isinstance(solution, SolutionSummary) for solution in recommended_solns))
+
+
+class TestSolution(unittest.TestCase):
+
+    def test_storage_growth(self):
+        myproblem = ExampleProblem()
+        solution = Solution((0.5,), myproblem, expected_reps=3)
+        self.assertEqual(solution.storage_size, 3)
+        solution.attach_rngs([MRG32k3a(s_ss_sss_index=[2, 0, 0])], copy=False)
+        myproblem.simulate(solution, 2)
+        myproblem.simulate(solution, 2)
+        self.assertEqual(solution.storage_size, 6)
+        # A large request reserves exactly the rows it needs.
+        myproblem.simulate(solution, 10)
+        self.assertEqual(solution.storage_size, 14)
+        self.assertEqual(solution.objectives.shape, (14, 1))
+        myproblem.simulate(solution, 1)
+        self.assertEqual(solution.storage_size, 28)
+        reference = simulate_solution(myproblem, 15)
+        self.assertTrue(np.array_equal(solution.objectives[:15], reference.objectives[:15]))
+
+    def test_gradient_storage(self):
+        myproblem = ExampleProblem()
+        solution = Solution((0.5,), myproblem)
+        self.assertIsNone(solution.objectives_gradients)
+        solution = Solution((0.5,), myproblem, store_gradients=True)
+        self.assertEqual(solution.objectives_gradients.shape, (100, 1, 1))
+        solution.attach_rngs([MRG32k3a(s_ss_sss_index=[2, 0, 0])], copy=False)
+        myproblem.simulate(solution, 150)
+        self.assertEqual(solution.objectives_gradients.shape, (150, 1, 1))
+
+    def test_summary_statistics(self):
+        myproblem = ExampleProblem()
+        solution = Solution((0.5,), myproblem)
+        solution.attach_rngs([MRG32k3a(s_ss_sss_index=[2, 0, 0])], copy=False)
+        for m in [1, 1, 5, 1, 20]:
+            myproblem.simulate(solution, m)
+        mean, var, stderr = solution.objectives_mean, solution.objectives_var, solution.objectives_stderr
+        solution.recompute_summary_statistics()
+        self.assertTrue(np.allclose(mean, solution.objectives_mean, rtol=1e-12))
+        self.assertTrue(np.allclose(var, solution.objectives_var, rtol=1e-10))
+        self.assertTrue(np.allclose(stderr, solution.objectives_stderr, rtol=1e-10))
+
+    def test_summarize(self):
+        myproblem = ExampleProblem()
+        solution = simulate_solution(myproblem, 10)
+        self.assertFalse(hasattr(solution, "__dict__"))
+        summary = solution.summarize()
+        self.assertEqual(summary.x, solution.x)
+        self.assertEqual(summary.n_reps, 10)
+        self.assertTrue(np.array_equal(summary.objectives_mean, solution.objectives_mean))
+        self.assertTrue(np.array_equal(summary.objectives_var, solution.objectives_var))
+
+    def test_lazy_rngs(self):
+        myproblem = ExampleProblem()
+        rngs = [MRG32k3a(s_ss_sss_index=[2, 0, 0])]
+        solution = Solution((0.5,), myproblem)
+        solution.attach_rngs(rngs, copy=True)
+        self.assertIsNotNone(solution.rng_snapshots)
+        rngs[0].advance_substream()
+        self.assertEqual(solution.rng_list[0].s_ss_sss_index, [2, 0, 0])
+        self.assertIsNone(solution.rng_snapshots)
+        myproblem.simulate(solution, 3)
+        self.assertTrue(np.array_equal(solution.objectives[:3], simulate_solution(myproblem, 3).objectives[:3]))
+
+
+if __name__ == '__main__':
+    unittest.main()
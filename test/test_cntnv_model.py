@@ -0,0 +1,32 @@
+import unittest
+import numpy as np
+from rng.mrg32k3a import MRG32k3a
+from models.cntnv import CntNV
+
+class TestCntNVModel(unittest.TestCase):
+
+    def test_replicate(self):
+        mymodel = CntNV()
+        rng_list = [MRG32k3a(s_ss_sss_index=[0, ss, 0]) for ss in range(mymodel.n_rngs)]
+        responses, gradients = mymodel.replicate(rng_list)
+        self.assertTrue(responses["stockout_qty"] >= 0)
+        self.assertEqual(responses["stockout"], int(responses["stockout_qty"] > 0))
+
+    def test_replicate_batch(self):
+        for order_quantity in [0.1, 0.5, 1.5]:
+            mymodel = CntNV({"order_quantity": order_quantity})
+            rng_list = [MRG32k3a(s_ss_sss_index=[0, ss, 0]) for ss in range(mymodel.n_rngs)]
+            responses, gradients = mymodel.replicate_batch(rng_list, 20)
+            rng_list2 = [MRG32k3a(s_ss_sss_index=[0, ss, 0]) for ss in range(mymodel.n_rngs)]
+            for rep in range(20):
+                rep_responses, rep_gradients = mymodel.replicate(rng_list2)
+                for key in rep_responses:
+                    self.assertEqual(responses[key][rep], rep_responses[key])
+                self.assertEqual(gradients["profit"]["order_quantity"][rep], rep_gradients["profit"]["order_quantity"])
+                for rng in rng_list2:
+                    rng.advance_subsubstream()
+            self.assertEqual([rng._current_state for rng in rng_list], [rng._current_state for rng in rng_list2])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,33 @@
+import unittest
+import numpy as np
+from rng.mrg32k3a import MRG32k3a
+from models.dualsourcing import DualSourcing
+
+class TestDualSourcingModel(unittest.TestCase):
+
+    def test_replicate(self):
+        mymodel = DualSourcing({"n_days": 200})
+        rng_list = [MRG32k3a(s_ss_sss_index=[0, ss, 0]) for ss in range(mymodel.n_rngs)]
+        responses, gradients = mymodel.replicate(rng_list)
+        for key in responses:
+            self.assertTrue(responses[key] >= 0)
+
+    def test_replicate_batch(self):
+        for factors in [{}, {"lead_exp": 1, "lead_reg": 5}, {"order_level_exp": 45, "order_level_reg": 95, "lead_exp": 3, "lead_reg": 9}]:
+            factors["n_days"] = 200
+            mymodel = DualSourcing(factors)
+            rng_list = [MRG32k3a(s_ss_sss_index=[0, ss, 0]) for ss in range(mymodel.n_rngs)]
+            responses, gradients = mymodel.replicate_batch(rng_list, 10)
+            rng_list2 = [MRG32k3a(s_ss_sss_index=[0, ss, 0]) for ss in range(mymodel.n_rngs)]
+            for rep in range(10):
+                rep_responses, rep_gradients = mymodel.replicate(rng_list2)
+                for key in rep_responses:
+                    self.assertEqual(responses[key][rep], rep_responses[key])
+                    self.assertTrue(np.isnan(gradients[key]["n_days"][rep]))
+                for rng in rng_list2:
+                    rng.advance_subsubstream()
+            self.assertEqual([rng._current_state for rng in rng_list], [rng._current_state for rng in rng_list2])
+
+
+if __name__ == '__main__':
+    unittest.main()
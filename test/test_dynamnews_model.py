@@ -0,0 +1,37 @@
+import unittest
+import numpy as np
+from rng.mrg32k3a import MRG32k3a
+from models.dynamnews import DynamNews
+
+class TestDynamNewsModel(unittest.TestCase):
+
+    def reference_inventory(self, mymodel, rng):
+        # Let customers choose one at a time among the products in stock.
+        num_customer = mymodel.factors["num_customer"]
+        num_prod = mymodel.factors["num_prod"]
+        inventory = np.array(mymodel.factors["init_level"], dtype=float)
+        for t in range(num_customer):
+            utility = [0] + [mymodel.factors["c_utility"][j] + rng.gumbelvariate(-mymodel.factors["mu"] * np.euler_gamma, mymodel.factors["mu"]) for j in range(num_prod)]
+            choice = 0
+            for j in range(num_prod):
+                if inventory[j] > 0 and utility[j + 1] > utility[choice]:
+                    choice = j + 1
+            if choice != 0:
+                inventory[choice - 1] -= 1
+        return inventory
+
+    def test_replicate(self):
+        num_prod = 6
+        for init_level in [[0, 1, 2, 5, 0, 3], [2.5] * num_prod, [40] * num_prod]:
+            mymodel = DynamNews({"num_prod": num_prod, "num_customer": 60, "c_utility": [5.0 + j for j in range(num_prod)],
+                                 "init_level": init_level, "price": [9] * num_prod, "cost": [5] * num_prod})
+            for sss in range(5):
+                responses, gradients = mymodel.replicate([MRG32k3a(s_ss_sss_index=[0, 0, sss])])
+                inventory = self.reference_inventory(mymodel, MRG32k3a(s_ss_sss_index=[0, 0, sss]))
+                numsold = np.array(init_level) - inventory
+                self.assertEqual(responses["profit"], np.sum(numsold * 9 - np.array(init_level) * 5))
+                self.assertEqual(responses["n_prod_stockout"], np.sum(inventory == 0))
+
+
+if __name__ == '__main__':
+    unittest.main()
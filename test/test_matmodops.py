@@ -48,5 +48,19 @@ class TestMatModOps(unittest.TestCase):
     def test_mat33_power_mod_power2(self):
         self.assertEqual(mat33_power_mod(A, 2, m), [[0, 0, 0], [0, 0, 0], [0, 0, 0]])
 
+    def test_mat33_mat31_mod_array(self):
+        m_big = 4294967087
+        A_big = [[3230096243, 2131723358, 3262178024],
+                 [2882890127, 4088518247, 2131723358],
+                 [-810728, 1403580, 0]
+                 ]
+        B_big = [[0, 0, 0], [1, 2, 3], [m_big - 1, m_big - 2, m_big - 3], [12345, 4000000000, 98765]]
+        res = mat33_mat31_mod_array(A_big, B_big, m_big)
+        for k in range(len(B_big)):
+            self.assertEqual(list(res[k]), [x % m_big for x in mat33_mat31_mult(A_big, B_big[k])])
+
+    def test_mat33_mat31_mod_array_small(self):
+        self.assertEqual(mat33_mat31_mod_array(A, [b, b], m).tolist(), [[2, 2, 2], [2, 2, 2]])
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
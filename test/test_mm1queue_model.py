@@ -0,0 +1,61 @@
+import unittest
+import numpy as np
+from rng.mrg32k3a import MRG32k3a
+from models.mm1queue import MM1Queue
+
+class TestMM1QueueModel(unittest.TestCase):
+
+    def test_replicate(self):
+        mymodel = MM1Queue()
+        rng_list = [MRG32k3a(s_ss_sss_index=[0, ss, 0]) for ss in range(mymodel.n_rngs)]
+        responses, gradients = mymodel.replicate(rng_list)
+        self.assertTrue(0 <= responses["avg_waiting_time"] <= responses["avg_sojourn_time"])
+        self.assertTrue(0 <= responses["frac_cust_wait"] <= 1)
+        self.assertTrue(gradients["avg_sojourn_time"]["mu"] < 0)
+
+    def test_replicate_batch(self):
+        mymodel = MM1Queue({"lambda": 2.9, "people": 200})
+        rng_list = [MRG32k3a(s_ss_sss_index=[0, ss, 0]) for ss in range(mymodel.n_rngs)]
+        responses, gradients = mymodel.replicate_batch(rng_list, 5)
+        rng_list2 = [MRG32k3a(s_ss_sss_index=[0, ss, 0]) for ss in range(mymodel.n_rngs)]
+        for rep in range(5):
+            rep_responses, rep_gradients = mymodel.replicate(rng_list2)
+            for key in rep_responses:
+                self.assertEqual(responses[key][rep], rep_responses[key])
+            self.assertEqual(gradients["avg_sojourn_time"]["mu"][rep], rep_gradients["avg_sojourn_time"]["mu"])
+            for rng in rng_list2:
+                rng.advance_subsubstream()
+        self.assertEqual([rng._current_state for rng in rng_list], [rng._current_state for rng in rng_list2])
+
+    def test_replicate_reference(self):
+        # Simulate the queue customer by customer with the Lindley recursion.
+        for fixed_factors in [{}, {"lambda": 0.5}, {"lambda": 2.9, "people": 500}]:
+            mymodel = MM1Queue(fixed_factors)
+            total = mymodel.factors["warmup"] + mymodel.factors["people"]
+            for sss in range(3):
+                responses, gradients = mymodel.replicate([MRG32k3a(s_ss_sss_index=[0, ss, sss]) for ss in range(mymodel.n_rngs)])
+                arrival_rng, service_rng = [MRG32k3a(s_ss_sss_index=[0, ss, sss]) for ss in range(mymodel.n_rngs)]
+                arrival = 0
+                departures = []
+                sojourn_times = []
+                waiting_times = []
+                waits = []
+                for i in range(total):
+                    arrival += arrival_rng.expovariate(mymodel.factors["lambda"])
+                    service = service_rng.expovariate(mymodel.factors["mu"])
+                    if i == 0:
+                        departures.append(arrival + service)
+                        sojourn_times.append(service)
+                        waiting_times.append(0)
+                    else:
+                        departures.append(max(arrival, departures[-1]) + service)
+                        sojourn_times.append(departures[-1] - arrival)
+                        waiting_times.append(sojourn_times[-1] - service)
+                    waits.append(sum(departure > arrival for departure in departures[:-1]) > 0)
+                warmup = mymodel.factors["warmup"]
+                self.assertEqual(responses["frac_cust_wait"], np.mean(waits[warmup:]))
+                self.assertEqual(responses["avg_waiting_time"], np.mean(waiting_times[warmup:]))
+                self.assertEqual(responses["avg_sojourn_time"], np.mean(sojourn_times[warmup:]))
+
+if __name__ == '__main__':
+    unittest.main()
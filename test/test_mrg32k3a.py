@@ -1,4 +1,8 @@
 import unittest
+import sys
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
 
 from rng.mrg32k3a import *
 
@@ -25,6 +29,30 @@ A2p76 = [[1511326704, 3759209742, 1610795712],
 seed = (12345, 12345, 12345, 12345, 12345, 12345)
 
 
+def bsm_reference(u):
+    """Beasley-Springer-Moro algorithm as originally implemented."""
+    y = u - 0.5
+    if abs(y) < 0.42:
+        r = pow(y, 2)
+        r2 = pow(r, 2)
+        r3 = pow(r, 3)
+        r4 = pow(r, 4)
+        asum = sum([bsma[0], bsma[1] * r, bsma[2] * r2, bsma[3] * r3])
+        bsum = sum([1, bsmb[0] * r, bsmb[1] * r2, bsmb[2] * r3, bsmb[3] * r4])
+        z = y * (asum / bsum)
+    else:
+        if y < 0.0:
+            signum = -1
+            r = u
+        else:
+            signum = 1
+            r = 1 - u
+        s = log(-log(r))
+        clst = [bsmc[0]] + [bsmc[k] * pow(s, k) for k in range(1, 9)]
+        z = signum * sum(clst)
+    return z
+
+
 class TestMRG32k3a(unittest.TestCase):
 
     def test_A1p127(self):
@@ -179,5 +207,249 @@ class TestMRG32k3a(unittest.TestCase):
         self.assertEqual(rng.subsubstream_start, rng2.subsubstream_start)
         self.assertEqual(rng.s_ss_sss_index, rng2.s_ss_sss_index)
 
+    def test_random_block(self):
+        rng = MRG32k3a(s_ss_sss_index=[1, 2, 3])
+        rng2 = MRG32k3a(s_ss_sss_index=[1, 2, 3])
+        for n in [0, 1, 2, 5, 100, block_segment_threshold, 3 * block_segment_threshold + 7]:
+            u = rng.random_block(n)
+            u2 = [rng2.random() for _ in range(n)]
+            self.assertEqual(list(u), u2)
+            self.assertEqual(rng._current_state, rng2._current_state)
+
+    def test_normalvariates(self):
+        rng = MRG32k3a()
+        rng2 = MRG32k3a()
+        z = rng.normalvariates(2, 3, 500)
+        z2 = [rng2.normalvariate(2, 3) for _ in range(500)]
+        self.assertEqual(list(z), z2)
+        self.assertEqual(rng._current_state, rng2._current_state)
+
+    def test_mvnormalvariate(self):
+        rng = MRG32k3a()
+        rng2 = MRG32k3a()
+        chol = np.array([[1.0, 0.0, 0.0], [0.5, 2.0, 0.0], [0.1, 0.2, 3.0]])
+        for _ in range(100):
+            x = rng.mvnormalvariate(np.array([1.0, 2.0, 3.0]), chol)
+            x2 = chol.dot([rng2.normalvariate(0, 1) for _ in range(3)]) + np.array([1.0, 2.0, 3.0])
+            self.assertEqual(list(x), list(x2))
+        self.assertEqual(rng._current_state, rng2._current_state)
+
+    def test_expovariates(self):
+        rng = MRG32k3a()
+        rng2 = MRG32k3a()
+        x = rng.expovariates(1.5, 500)
+        x2 = [rng2.expovariate(1.5) for _ in range(500)]
+        self.assertEqual(list(x), x2)
+        self.assertEqual(rng._current_state, rng2._current_state)
+
+    def test_lognormalvariates(self):
+        rng = MRG32k3a()
+        rng2 = MRG32k3a()
+        x = rng.lognormalvariates(10, 200, 500)
+        x2 = [rng2.lognormalvariate(10, 200) for _ in range(500)]
+        self.assertEqual(list(x), x2)
+        self.assertEqual(rng._current_state, rng2._current_state)
+
+    def test_gammavariates(self):
+        for alpha in [0.5, 1.0, 2.5]:
+            rng = MRG32k3a()
+            rng2 = MRG32k3a()
+            x = rng.gammavariates(alpha, 2, 200)
+            x2 = [rng2.gammavariate(alpha, 2) for _ in range(200)]
+            self.assertEqual(list(x), x2)
+            self.assertEqual(rng._current_state, rng2._current_state)
+
+    def test_betavariates(self):
+        rng = MRG32k3a()
+        rng2 = MRG32k3a()
+        x = rng.betavariates(2, 3, 200)
+        x2 = [rng2.betavariate(2, 3) for _ in range(200)]
+        self.assertEqual(list(x), x2)
+        self.assertEqual(rng._current_state, rng2._current_state)
+
+    def test_poissonvariates(self):
+        for lmbda in [0.5, 3, 34.9, 50]:
+            for n in [0, 1, 5, 200]:
+                rng = MRG32k3a()
+                rng2 = MRG32k3a()
+                x = rng.poissonvariates(lmbda, n)
+                x2 = [rng2.poissonvariate(lmbda) for _ in range(n)]
+                self.assertEqual(list(x), x2)
+                self.assertEqual(rng._current_state, rng2._current_state)
+
+    def test_gumbelvariates(self):
+        rng = MRG32k3a()
+        rng2 = MRG32k3a()
+        x = rng.gumbelvariates(1, 2, 500)
+        x2 = [rng2.gumbelvariate(1, 2) for _ in range(500)]
+        self.assertEqual(list(x), x2)
+        self.assertEqual(rng._current_state, rng2._current_state)
+
+    def test_bsm(self):
+        u = np.concatenate((MRG32k3a().random_block(10000), [1e-12, 0.08, 0.0799999, 0.5, 0.92, 0.9200001, 1 - 1e-12]))
+        z_ref = np.array([bsm_reference(v) for v in u])
+        z = np.array([bsm(v) for v in u])
+        self.assertTrue(np.array_equal(z, z_ref))
+        self.assertTrue(np.array_equal(bsm_array(u), z))
+
+    def test_jump_matrices(self):
+        bases = [(A1p141, A2p141), (A1p94, A2p94), (A1p47, A2p47)]
+        for level in range(3):
+            for k in [0, 1, 2, 3, 100, 12345, 2**47 - 1]:
+                A1k, A2k = jump_matrices(level, k)
+                self.assertEqual([list(row) for row in A1k], mat33_power_mod(bases[level][0], k, mrgm1))
+                self.assertEqual([list(row) for row in A2k], mat33_power_mod(bases[level][1], k, mrgm2))
+
+    def test_jump_matrices_threads(self):
+        # Extend the power tables concurrently from several threads.
+        ks = [2**90 + i for i in range(16)]
+        switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                results = list(executor.map(lambda k: jump_matrices(2, k), ks))
+        finally:
+            sys.setswitchinterval(switch_interval)
+        # Reference powers A^(2^90 + i) = (A^(2^45))^(2^45) A^i, with exponents exact in floating point.
+        A1p47p90 = mat33_power_mod(mat33_power_mod(A1p47, 2**45, mrgm1), 2**45, mrgm1)
+        A2p47p90 = mat33_power_mod(mat33_power_mod(A2p47, 2**45, mrgm2), 2**45, mrgm2)
+        for i, (A1k, A2k) in enumerate(results):
+            self.assertEqual([list(row) for row in A1k], mat33_mat33_mod(A1p47p90, mat33_power_mod(A1p47, i, mrgm1), mrgm1))
+            self.assertEqual([list(row) for row in A2k], mat33_mat33_mod(A2p47p90, mat33_power_mod(A2p47, i, mrgm2), mrgm2))
+
+    def test_start_fixed_s_ss_sss_deep(self):
+        rng = MRG32k3a(s_ss_sss_index=[5, 1000, 123456])
+        st1 = list(seed[0:3])
+        st2 = list(seed[3:6])
+        for A1, A2, k in [(A1p141, A2p141, 5), (A1p94, A2p94, 1000), (A1p47, A2p47, 123456)]:
+            st1 = mat31_mod(mat33_mat31_mult(mat33_power_mod(A1, k, mrgm1), st1), mrgm1)
+            st2 = mat31_mod(mat33_mat31_mult(mat33_power_mod(A2, k, mrgm2), st2), mrgm2)
+        self.assertEqual(rng._current_state, tuple(st1 + st2))
+
+    def test_jump_states(self):
+        rngs = [MRG32k3a(s_ss_sss_index=[s, 3, 0]) for s in range(10)]
+        states = jump_states([rng._current_state for rng in rngs], level=1, k=2)
+        for rng, state in zip(rngs, states):
+            rng.advance_substream()
+            rng.advance_substream()
+            self.assertEqual(rng._current_state, tuple(state))
+
+    def test_spawn_grid(self):
+        grid = MRG32k3a.spawn_grid(n_streams=5, n_substreams=7, s_ss_sss_index=[2, 3, 4])
+        self.assertEqual(len(grid), 5)
+        for i in range(5):
+            self.assertEqual(len(grid[i]), 7)
+            for j in range(7):
+                rng = grid[i][j]
+                rng2 = MRG32k3a(s_ss_sss_index=[2 + i, 3 + j, 4])
+                self.assertEqual(rng._current_state, rng2._current_state)
+                self.assertEqual(rng.stream_start, rng2.stream_start)
+                self.assertEqual(rng.substream_start, rng2.substream_start)
+                self.assertEqual(rng.subsubstream_start, rng2.subsubstream_start)
+                self.assertEqual(rng.s_ss_sss_index, rng2.s_ss_sss_index)
+                self.assertEqual(rng.random(), rng2.random())
+
+    def test_deepcopy(self):
+        rng = MRG32k3a(s_ss_sss_index=[1, 2, 3])
+        rng.random()
+        rng2 = deepcopy(rng)
+        self.assertEqual(rng2._current_state, rng._current_state)
+        self.assertEqual(rng2.s_ss_sss_index, rng.s_ss_sss_index)
+        rng2.advance_subsubstream()
+        self.assertEqual(rng.s_ss_sss_index, [1, 2, 3])
+        self.assertEqual(rng.random(), MRG32k3a(s_ss_sss_index=[1, 2, 3]).random_block(2)[1])
+
+    def test_pickle(self):
+        rng = MRG32k3a(ref_seed=(1, 2, 3, 4, 5, 6), s_ss_sss_index=[1, 2, 3])
+        rng.random()
+        rng2 = pickle.loads(pickle.dumps(rng))
+        self.assertEqual(rng2.ref_seed, rng.ref_seed)
+        self.assertEqual(rng2.s_ss_sss_index, rng.s_ss_sss_index)
+        self.assertEqual(rng2.stream_start, rng.stream_start)
+        self.assertEqual(rng2.substream_start, rng.substream_start)
+        self.assertEqual(rng2.subsubstream_start, rng.subsubstream_start)
+        self.assertEqual(rng2.random(), rng.random())
+        rng2.advance_substream()
+        rng.advance_substream()
+        self.assertEqual(rng2._current_state, rng._current_state)
+
+    def test_snapshot(self):
+        rng = MRG32k3a(ref_seed=(1, 2, 3, 4, 5, 6), s_ss_sss_index=[1, 2, 3])
+        rng.random()
+        rng2 = MRG32k3a.restore(rng.snapshot())
+        self.assertEqual(rng2.ref_seed, rng.ref_seed)
+        self.assertEqual(rng2.s_ss_sss_index, rng.s_ss_sss_index)
+        self.assertEqual(rng2.subsubstream_start, rng.subsubstream_start)
+        self.assertEqual(rng2.random(), rng.random())
+        rng2.advance_substream()
+        self.assertEqual(rng.s_ss_sss_index, [1, 2, 3])
+        rng.advance_substream()
+        self.assertEqual(rng2._current_state, rng._current_state)
+
+    def test_skip(self):
+        rng = MRG32k3a(s_ss_sss_index=[1, 1, 1])
+        rng2 = MRG32k3a(s_ss_sss_index=[1, 1, 1])
+        for n in [0, 1, 5, 1000]:
+            rng.skip(n)
+            rng2.random_block(n)
+            self.assertEqual(rng._current_state, rng2._current_state)
+        self.assertEqual(rng.s_ss_sss_index, [1, 1, 1])
+
+    def test_skip_subsubstream(self):
+        rng = MRG32k3a()
+        rng.skip(2**47)
+        rng2 = MRG32k3a(s_ss_sss_index=[0, 0, 1])
+        self.assertEqual(rng._current_state, rng2._current_state)
+
+    def test_at_offset(self):
+        rng = MRG32k3a(s_ss_sss_index=[0, 2, 3])
+        u = rng.random_block(100)
+        rng.at_offset(41)
+        self.assertEqual(rng.random(), u[41])
+        rng.at_offset(0)
+        self.assertEqual(rng.random(), u[0])
+
+    def test_lanes_random(self):
+        rngs = [MRG32k3a(s_ss_sss_index=[s, 1, 2]) for s in range(6)]
+        lanes = MRG32k3aLanes([deepcopy(rng) for rng in rngs])
+        u = lanes.random_block(50)
+        for k, rng in enumerate(rngs):
+            self.assertEqual(list(u[k]), list(rng.random_block(50)))
+        self.assertEqual([rng._current_state for rng in lanes.to_rngs()], [rng._current_state for rng in rngs])
+
+    def test_lanes_advance_subsubstream(self):
+        rngs = [MRG32k3a(s_ss_sss_index=[0, ss, 0]) for ss in range(4)]
+        lanes = MRG32k3aLanes(rngs)
+        lanes.random()
+        lanes.advance_subsubstream()
+        lanes.advance_subsubstream()
+        for k, rng in enumerate(lanes.to_rngs()):
+            rng2 = MRG32k3a(s_ss_sss_index=[0, k, 2])
+            self.assertEqual(rng._current_state, rng2._current_state)
+            self.assertEqual(rng.subsubstream_start, rng2.subsubstream_start)
+            self.assertEqual(rng.s_ss_sss_index, rng2.s_ss_sss_index)
+        lanes.advance_substream()
+        self.assertEqual(lanes.s_ss_sss_indices.tolist(), [[0, k + 1, 0] for k in range(4)])
+        self.assertEqual(list(lanes.normalvariate(1, 2)), [rng.normalvariate(1, 2) for rng in [MRG32k3a(s_ss_sss_index=[0, k + 1, 0]) for k in range(4)]])
+
+    def test_lanes_expovariate(self):
+        rngs = [MRG32k3a(s_ss_sss_index=[s, 0, 1]) for s in range(5)]
+        lanes = MRG32k3aLanes([deepcopy(rng) for rng in rngs])
+        for _ in range(100):
+            self.assertEqual(list(lanes.expovariate(2.5)), [rng.expovariate(2.5) for rng in rngs])
+
+    def test_subsubstream_lanes(self):
+        rng = MRG32k3a(s_ss_sss_index=[3, 4, 5])
+        rng.random()
+        rng2 = deepcopy(rng)
+        lanes = rng.subsubstream_lanes(4)
+        u = lanes.random_block(3)
+        for k in range(4):
+            self.assertEqual(list(u[k]), [rng2.random() for _ in range(3)])
+            rng2.advance_subsubstream()
+        self.assertEqual(rng._current_state, rng2._current_state)
+        self.assertEqual(rng.s_ss_sss_index, [3, 4, 9])
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
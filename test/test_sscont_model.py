@@ -1,4 +1,5 @@
 import unittest
+import numpy as np
 from rng.mrg32k3a import MRG32k3a
 from models.sscont import SSCont
 
@@ -17,5 +18,39 @@ class TestSSContModel(unittest.TestCase):
         self.assertTrue(0 <= responses["avg_order_costs"])
         self.assertTrue(0 <= responses["avg_holding_costs"])
 
+    def reference_orders(self, mymodel, rng_list):
+        # Recompute the inventory position each day by summing the outstanding orders.
+        n_periods = mymodel.factors["n_days"] + mymodel.factors["warmup"]
+        demands = [rng_list[0].expovariate(1/mymodel.factors["demand_mean"]) for _ in range(n_periods)]
+        inv = mymodel.factors["s"]
+        orders = []  # (amount, arrival day) of each order placed
+        orders_placed = np.zeros(n_periods)
+        end_inv = np.zeros(n_periods)
+        for day in range(n_periods):
+            inv = inv - demands[day]
+            end_inv[day] = inv
+            inv_pos = inv + sum(amount for amount, arrival in orders if arrival > day)
+            if inv_pos < mymodel.factors["s"]:
+                orders_placed[day] = mymodel.factors["S"] - inv_pos
+                orders.append((orders_placed[day], day + rng_list[1].poissonvariate(mymodel.factors["lead_mean"]) + 1))
+            inv = inv + sum(amount for amount, arrival in orders if arrival == day + 1)
+        return orders_placed, end_inv
+
+    def test_replicate_reference(self):
+        for fixed_factors in [{}, {"lead_mean": 0.5}, {"lead_mean": 30.0, "n_days": 200}, {"s": 1e6, "S": 1e6 + 50, "lead_mean": 30.0, "n_days": 200}]:
+            mymodel = SSCont(fixed_factors)
+            warmup = mymodel.factors["warmup"]
+            for sss in range(3):
+                rng_list = [MRG32k3a(s_ss_sss_index=[0, ss, sss]) for ss in range(mymodel.n_rngs)]
+                responses, gradients = mymodel.replicate(rng_list)
+                rng_list2 = [MRG32k3a(s_ss_sss_index=[0, ss, sss]) for ss in range(mymodel.n_rngs)]
+                orders_placed, end_inv = self.reference_orders(mymodel, rng_list2)
+                self.assertEqual(responses["order_rate"], np.mean(orders_placed[warmup:] > 0))
+                self.assertEqual(responses["stockout_rate"], np.mean(end_inv[warmup:] < 0))
+                self.assertEqual(responses["avg_order"], np.mean(orders_placed[warmup:][orders_placed[warmup:] > 0]))
+                self.assertEqual(responses["avg_holding_costs"], np.mean(mymodel.factors["holding_cost"] * end_inv[warmup:] * [end_inv[warmup:] > 0]))
+                self.assertEqual([rng.get_current_state() for rng in rng_list], [rng.get_current_state() for rng in rng_list2])
+
+
 if __name__ == '__main__':
     unittest.main()